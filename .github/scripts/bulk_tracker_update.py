@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Bulk updates of the Week/Module and Projects & Assignments tables in course READMEs.
+
+The course README generated by generate_course_readme has a "Progress Tracker" table
+(Week/Module | Status | Completion Date | Notes) and a "Projects & Assignments" table
+(Project/Assignment | Status | Repository Link | Grade/Feedback | Completion Date).
+This script applies a batch of row updates across many course READMEs and learner
+repositories in one pass: updates are grouped per file, every file is read and parsed
+once, patched, and atomically replaced, and files are processed in parallel.
+
+Mark Week 3 complete in CS50 for every learner in a cohort:
+
+    python .github/scripts/bulk_tracker_update.py --cohort learners/ --course CS50 --week 3 --done
+
+Or apply a batch file of JSON lines such as
+{"learner": "learners/alice", "course": "cs50", "week": 3, "status": "Completed"} or
+{"learner": "learners/bob", "course": "cs50", "assignment": "Project 1", "grade": "A"}:
+
+    python .github/scripts/bulk_tracker_update.py --batch updates.jsonl
+"""
+
+import os
+import re
+import json
+import argparse
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog import course_dir_name, resolve_course
+from course_status import collect_learner_roots
+from profiling import profile_from_argv, profiling_active
+
+# First header cell of each table that can be updated
+WEEK_TABLE = "Week/Module"
+ASSIGNMENT_TABLE = "Project/Assignment"
+
+# Update fields -> table column names
+WEEK_FIELDS = {"status": "Status", "date": "Completion Date", "notes": "Notes"}
+ASSIGNMENT_FIELDS = {"status": "Status", "repo": "Repository Link", "grade": "Grade/Feedback",
+                     "date": "Completion Date"}
+
+
+def split_row(line):
+    """Split a Markdown table row into its raw cells (without the outer pipes)."""
+    return re.split(r'(?<!\\)\|', line.rstrip("\n").strip()[1:-1])
+
+
+def escape_cell(value):
+    """Make a value safe for a table cell: escape "|" and fold newlines into spaces."""
+    text = " ".join(str(value).splitlines())
+    return re.sub(r'(?<!\\)\|', r'\\|', text)
+
+
+def parse_tables(lines):
+    """
+    Find the rows of the week and assignment tables.
+
+    Returns:
+        {table name: (column names, {row label lowercased: line index})}
+    """
+    tables = {}
+    current = None
+    for i, line in enumerate(lines):
+        if not line.startswith("|"):
+            current = None
+            continue
+        cells = [cell.strip() for cell in split_row(line)]
+        if current is None:
+            if cells[0] in (WEEK_TABLE, ASSIGNMENT_TABLE):
+                current = cells[0]
+                tables[current] = (cells, {})
+            else:
+                current = ""
+            continue
+        if current and not set(cells[0]) <= set("-: "):
+            tables[current][1].setdefault(cells[0].lower(), i)
+    return tables
+
+
+def apply_update(lines, tables, update):
+    """
+    Patch one row in place in the list of lines.
+
+    Returns:
+        True if the row changed, False if it was already up to date.
+    """
+    if "week" in update:
+        table, label, fields = WEEK_TABLE, f"Week {update['week']}", WEEK_FIELDS
+    else:
+        table, label, fields = ASSIGNMENT_TABLE, update["assignment"], ASSIGNMENT_FIELDS
+
+    if table not in tables:
+        raise KeyError(f"no '{table}' table")
+    columns, rows = tables[table]
+    if label.lower() not in rows:
+        raise KeyError(f"no '{label}' row")
+
+    i = rows[label.lower()]
+    cells = split_row(lines[i])
+    for field, column in fields.items():
+        if field in update and column in columns:
+            position = columns.index(column)
+            if position < len(cells):
+                cells[position] = f" {escape_cell(update[field])} "
+
+    ending = "\n" if lines[i].endswith("\n") else ""
+    new_line = "|" + "|".join(cells) + "|" + ending
+    if new_line == lines[i]:
+        return False
+    lines[i] = new_line
+    return True
+
+
+def patch_file(readme_path, updates):
+    """
+    Read a course README once, apply all its updates and atomically replace it.
+
+    Returns:
+        (path, number of rows changed, list of error messages)
+    """
+    try:
+        with open(readme_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError as e:
+        return readme_path, 0, [str(e)]
+
+    tables = parse_tables(lines)
+    changed = 0
+    errors = []
+    for update in updates:
+        try:
+            changed += apply_update(lines, tables, update)
+        except KeyError as e:
+            errors.append(e.args[0])
+
+    if changed:
+        tmp_path = f"{readme_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.writelines(lines)
+        os.replace(tmp_path, readme_path)
+    return readme_path, changed, errors
+
+
+def course_directory(course):
+    """Return the directory of a course from its name, alias or directory name."""
+    resolved = resolve_course(course)
+    return course_dir_name(resolved) if resolved else course
+
+
+def group_updates(updates):
+    """Group updates by the course README they apply to, preserving their order."""
+    by_file = {}
+    for update in updates:
+        readme_path = os.path.join(update["learner"], course_directory(update["course"]), "README.md")
+        by_file.setdefault(readme_path, []).append(update)
+    return by_file
+
+
+def run_updates(updates, workers=None):
+    """
+    Apply updates across all affected README files in parallel.
+
+    Under --profile the files are patched in this process, since the profiler
+    does not see into pool workers.
+
+    Args:
+        updates: List of update dicts with learner, course and week or assignment
+        workers: Number of worker processes (default: one per CPU)
+
+    Returns:
+        (files changed, rows changed, number of errors)
+    """
+    by_file = group_updates(updates)
+    files_changed = rows_changed = error_count = 0
+
+    def tally(results):
+        nonlocal files_changed, rows_changed, error_count
+        for readme_path, changed, errors in results:
+            files_changed += bool(changed)
+            rows_changed += changed
+            for error in errors:
+                print(f"WARNING: {readme_path}: {error}")
+            error_count += len(errors)
+
+    if profiling_active():
+        tally(map(patch_file, by_file.keys(), by_file.values()))
+        return files_changed, rows_changed, error_count
+
+    # Larger chunks keep the per-task overhead low when there are thousands of files
+    chunksize = max(1, len(by_file) // ((workers or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tally(executor.map(patch_file, by_file.keys(), by_file.values(), chunksize=chunksize))
+
+    return files_changed, rows_changed, error_count
+
+
+def read_batch(batch_path):
+    """Read updates from a JSON lines batch file."""
+    updates = []
+    with open(batch_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            update = json.loads(line)
+            if "learner" not in update or "course" not in update or not ("week" in update or "assignment" in update):
+                raise ValueError(f"{batch_path}:{line_number}: need learner, course and week or assignment")
+            updates.append(update)
+    return updates
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk update course README tracker tables.")
+    parser.add_argument("learners", nargs="*", help="Learner repository paths")
+    parser.add_argument("--cohort", help="Directory whose subdirectories are learner repositories")
+    parser.add_argument("--batch", help="JSON lines file of updates")
+    parser.add_argument("--course", help="Course name, alias or directory")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--week", type=int, help="Week/Module number to update")
+    target.add_argument("--assignment", help="Project/Assignment row to update")
+    parser.add_argument("--done", action="store_true", help="Mark the row Completed (with today's date)")
+    parser.add_argument("--status", help="Set the Status cell")
+    parser.add_argument("--notes", help="Set the Notes cell (weeks)")
+    parser.add_argument("--grade", help="Set the Grade/Feedback cell (assignments)")
+    parser.add_argument("--repo", help="Set the Repository Link cell (assignments)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU; none under --profile)")
+    args = parser.parse_args()
+
+    updates = read_batch(args.batch) if args.batch else []
+
+    learner_roots = collect_learner_roots(args.learners, args.cohort, default=False)
+
+    if args.week is not None or args.assignment:
+        if not args.course or not learner_roots:
+            parser.error("--week/--assignment need --course and learner repositories")
+        template = {"course": args.course}
+        if args.week is not None:
+            template["week"] = args.week
+        else:
+            template["assignment"] = args.assignment
+        if args.done:
+            template["status"] = "Completed"
+            template["date"] = datetime.now().strftime("%Y-%m-%d")
+        for field in ("status", "notes", "grade", "repo"):
+            if getattr(args, field):
+                template[field] = getattr(args, field)
+        updates.extend(dict(template, learner=learner) for learner in learner_roots)
+
+    if not updates:
+        parser.error("nothing to do; pass --batch or --week/--assignment with learners")
+
+    files_changed, rows_changed, error_count = run_updates(updates, args.workers)
+    print(f"Updated {rows_changed} rows in {files_changed} files ({error_count} errors)")
+
+
+if __name__ == "__main__":
+    with profile_from_argv("bulk_tracker_update"):
+        main()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Loading of the OSSU curriculum catalog.
+
+The catalog lives in .github/data/curriculum.json as {category: [course, ...]}, where each
+course has a name, full_name, aliases, url, institution, platform and prerequisites.
+Parsing and validating it on every invocation is wasteful, so the validated catalog is
+snapshotted with marshal next to the data file, keyed by the SHA-1 of the JSON source.
+As long as the source is unchanged, loading is a hash check plus a marshal.loads, and later
+loads in the same process only stat the file.
+
+Courses can be looked up by name, full name, alias or course directory name with
+resolve_course().
+"""
+
+import os
+import re
+import json
+import marshal
+import hashlib
+
+# Default catalog location, relative to this script so it works from any working directory
+CATALOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "curriculum.json")
+
+# Bumped whenever the snapshot layout changes, so stale snapshots are rebuilt
+CACHE_VERSION = 1
+
+REQUIRED_FIELDS = ("name", "full_name", "url", "institution", "platform")
+
+_loaded = {}
+
+
+class CatalogError(ValueError):
+    """Raised when the curriculum catalog is missing or invalid."""
+
+
+def normalize_key(text):
+    """Return the lookup key of a course name: lowercase alphanumerics only."""
+    return re.sub(r'[^a-z0-9]', '', text.lower())
+
+
+def course_dir_name(course):
+    """Return the directory name initialize_repo.py creates for a course."""
+    return course["name"].replace(" ", "-").lower()
+
+
+def compile_catalog(source, path):
+    """
+    Validate a parsed catalog and build its lookup table.
+
+    Returns:
+        (curriculum dict with "category" filled in on every course, {lookup key: (category, index)})
+    """
+    if not isinstance(source, dict):
+        raise CatalogError(f"{path}: expected an object mapping categories to course lists")
+
+    curriculum = {}
+    lookup = {}
+    names = set()
+    for category, courses in source.items():
+        if not isinstance(courses, list):
+            raise CatalogError(f"{path}: category '{category}' must be a list of courses")
+        curriculum[category] = []
+        for course in courses:
+            missing = [field for field in REQUIRED_FIELDS if not course.get(field)]
+            if missing:
+                raise CatalogError(f"{path}: course {course.get('name', '?')!r} is missing {', '.join(missing)}")
+            if course["name"] in names:
+                raise CatalogError(f"{path}: duplicate course name '{course['name']}'")
+            names.add(course["name"])
+
+            course = dict(course, category=category)
+            course.setdefault("aliases", [])
+            course.setdefault("prerequisites", [])
+            position = (category, len(curriculum[category]))
+            curriculum[category].append(course)
+
+            for key in [course["name"], course["full_name"], course_dir_name(course), *course["aliases"]]:
+                lookup.setdefault(normalize_key(key), position)
+
+    for courses in curriculum.values():
+        for course in courses:
+            for prerequisite in course["prerequisites"]:
+                if prerequisite not in names:
+                    raise CatalogError(f"{path}: unknown prerequisite '{prerequisite}' for '{course['name']}'")
+
+    return curriculum, lookup
+
+
+def load_catalog(path=CATALOG_PATH):
+    """
+    Load the curriculum catalog, using the marshal snapshot when it is up to date.
+
+    Args:
+        path: Path to the catalog JSON file
+
+    Returns:
+        (curriculum dict {category: [course, ...]}, lookup table for resolve_course)
+    """
+    path = os.path.abspath(path)
+    try:
+        stat = os.stat(path)
+    except OSError as e:
+        raise CatalogError(f"Could not read curriculum catalog {path}: {e}") from None
+
+    # Already loaded in this process and unchanged on disk: no read or hash needed
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _loaded.get(path)
+    if cached and cached[0] == stamp:
+        return cached[1], cached[2]
+
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError as e:
+        raise CatalogError(f"Could not read curriculum catalog {path}: {e}") from None
+    digest = hashlib.sha1(raw).hexdigest()
+
+    cache_path = os.path.join(os.path.dirname(path), "__pycache__", os.path.basename(path) + ".marshal")
+    try:
+        with open(cache_path, "rb") as f:
+            version, cached_digest, curriculum, lookup = marshal.loads(f.read())
+        if version != CACHE_VERSION or cached_digest != digest:
+            raise ValueError("stale snapshot")
+    except (OSError, ValueError, EOFError, TypeError):
+        try:
+            source = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise CatalogError(f"Invalid JSON in {path}: {e}") from None
+        curriculum, lookup = compile_catalog(source, path)
+
+        # The snapshot is only an optimization, so failing to write it is not an error
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                marshal.dump((CACHE_VERSION, digest, curriculum, lookup), f)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            print(f"Could not write catalog snapshot {cache_path}: {e}")
+
+    _loaded[path] = (stamp, curriculum, lookup)
+    return curriculum, lookup
+
+
+def load_curriculum(path=CATALOG_PATH):
+    """Return the curriculum dict {category: [course, ...]}."""
+    return load_catalog(path)[0]
+
+
+def resolve_course(name, path=CATALOG_PATH):
+    """
+    Find a course by name, full name, alias or directory name.
+
+    Returns:
+        The course dict, or None if no course matches.
+    """
+    curriculum, lookup = load_catalog(path)
+    position = lookup.get(normalize_key(name))
+    if position is None:
+        return None
+    category, index = position
+    return curriculum[category][index]
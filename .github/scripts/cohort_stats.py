@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Cohort statistics and completion forecasting for OSSU progress tracking.
+
+This script loads the status.json files of one or more learner repositories into
+NumPy arrays and computes, without per-record Python loops:
+1. The completion rate of each curriculum category
+2. The median number of days per course (start_date to completion_date)
+3. A linear projected finish date (ETA) for each learner
+
+The results can be written to a JSON summary and/or into each learner's README.md
+("Anticipated curriculum completion" line). Requires NumPy.
+
+The vectorized computation takes milliseconds even at 100k records; reading that many
+status.json files takes seconds. With --export the records are instead read from the
+CSV written by export_progress.py, which keeps a cohort-wide refresh under a second.
+"""
+
+import os
+import re
+import sys
+import csv
+import json
+import argparse
+from datetime import date
+
+import numpy as np
+
+from course_status import STATUSES, collect_learner_roots, find_status_files, load_status, StatusError
+from catalog import load_curriculum, resolve_course
+from export_progress import CSV_NAME
+from profiling import profile_from_argv
+
+# Status values as integer codes, in progression order
+STATUS_CODES = {status: code for code, status in enumerate(STATUSES)}
+
+# Sentinel for missing dates when working on datetime64[D] as integer days
+NO_DATE = np.iinfo(np.int64).max
+
+
+def build_cohort(records, learner_roots):
+    """
+    Turn status records into column arrays.
+
+    Args:
+        records: Iterable of (learner index, course name, status, progress, start date,
+                 completion date) with validated values
+        learner_roots: List of learner repository paths, indexed by learner index
+
+    Returns:
+        A dict of NumPy arrays (one entry per record) plus the course name list.
+    """
+    curriculum = load_curriculum()
+    course_index = {}
+    category_of_course = []
+    for category, courses in curriculum.items():
+        for course in courses:
+            course_index[course["full_name"]] = len(category_of_course)
+            category_of_course.append(category)
+    course_names = list(course_index)
+
+    # Course slot of every spelling seen so far, so each is resolved only once
+    slot_of_name = {}
+    learners, courses, statuses, progress, starts, completions = [], [], [], [], [], []
+    for learner_id, name, status, percentage, start_date, completion_date in records:
+        slot = slot_of_name.get(name)
+        if slot is None:
+            # Map aliases and older spellings onto the catalog's full name
+            course = resolve_course(name)
+            course_name = course["full_name"] if course else name
+            if course_name not in course_index:
+                # Courses outside the curriculum get their own slot
+                course_index[course_name] = len(course_names)
+                course_names.append(course_name)
+                category_of_course.append("Other")
+            slot = slot_of_name[name] = course_index[course_name]
+
+        learners.append(learner_id)
+        courses.append(slot)
+        statuses.append(STATUS_CODES[status])
+        progress.append(percentage)
+        starts.append(start_date or "NaT")
+        completions.append(completion_date or "NaT")
+
+    categories = list(dict.fromkeys(category_of_course))
+    category_codes = np.array([categories.index(c) for c in category_of_course], dtype=np.int32)
+    course_arr = np.array(courses, dtype=np.int32)
+
+    return {
+        "learner": np.array(learners, dtype=np.int32),
+        "course": course_arr,
+        "category": category_codes[course_arr],
+        "status": np.array(statuses, dtype=np.int8),
+        "progress": np.array(progress, dtype=np.float64),
+        "start_date": np.array(starts, dtype="datetime64[D]"),
+        "completion_date": np.array(completions, dtype="datetime64[D]"),
+        "course_names": course_names,
+        "categories": categories,
+        "curriculum_size": sum(len(courses) for courses in curriculum.values()),
+        "learner_roots": list(learner_roots),
+        "learner_count": len(learner_roots),
+    }
+
+
+def load_cohort(learner_roots):
+    """
+    Load the status records of all learners into column arrays.
+
+    Args:
+        learner_roots: List of learner repository paths
+    """
+    def records():
+        for learner_id, learner_root in enumerate(learner_roots):
+            for status_file in find_status_files(learner_root):
+                try:
+                    record = load_status(status_file)
+                except StatusError as e:
+                    print(f"Error reading {status_file}: {e}")
+                    continue
+                yield (learner_id, record.course_name, record.status, record.progress_percentage,
+                       record.start_date, record.completion_date)
+
+    return build_cohort(records(), learner_roots)
+
+
+def load_export(export_dir):
+    """
+    Load the latest exported record of every course from an export_progress.py export.
+
+    The CSV is appended to on every incremental export, so later rows of a course
+    replace earlier ones.
+
+    Args:
+        export_dir: Export directory holding status_records.csv
+    """
+    latest = {}
+    with open(os.path.join(export_dir, CSV_NAME), "r", encoding="utf-8", newline="") as f:
+        rows = csv.reader(f)
+        column = {name: i for i, name in enumerate(next(rows, []))}
+        learner, course_dir = column["learner_repo"], column["course_dir"]
+        for row in rows:
+            latest[row[learner], row[course_dir]] = row
+
+    fields = [column[name] for name in ("course_name", "status", "progress_percentage",
+                                         "start_date", "completion_date")]
+    learner_ids = {}
+    records = []
+    for (learner_root, _), row in latest.items():
+        name, status, percentage, start_date, completion_date = (row[i] for i in fields)
+        learner_id = learner_ids.setdefault(learner_root, len(learner_ids))
+        records.append((learner_id, name, status, float(percentage), start_date, completion_date))
+    return build_cohort(records, list(learner_ids))
+
+
+def category_completion_rates(cohort):
+    """Return the share of records marked Completed for each category."""
+    n_categories = len(cohort["categories"])
+    completed = (cohort["status"] == STATUS_CODES["Completed"]).astype(np.float64)
+    totals = np.bincount(cohort["category"], minlength=n_categories)
+    done = np.bincount(cohort["category"], weights=completed, minlength=n_categories)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        rates = np.where(totals > 0, done / totals, np.nan)
+    return dict(zip(cohort["categories"], rates))
+
+
+def median_days_per_course(cohort):
+    """Return the median days from start_date to completion_date for each course."""
+    n_courses = len(cohort["course_names"])
+    valid = ~np.isnat(cohort["start_date"]) & ~np.isnat(cohort["completion_date"])
+    days = (cohort["completion_date"][valid] - cohort["start_date"][valid]).astype(np.int64)
+    courses = cohort["course"][valid]
+
+    medians = np.full(n_courses, np.nan)
+    if len(days):
+        # Sort by course, then by duration, so each course's durations are a sorted run
+        order = np.lexsort((days, courses))
+        days, courses = days[order], courses[order]
+        counts = np.bincount(courses, minlength=n_courses)
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        has_data = counts > 0
+        lo = offsets[has_data] + (counts[has_data] - 1) // 2
+        hi = offsets[has_data] + counts[has_data] // 2
+        medians[has_data] = (days[lo] + days[hi]) / 2.0
+    return dict(zip(cohort["course_names"], medians))
+
+
+def forecast_completion(cohort, today=None):
+    """
+    Project each learner's curriculum finish date with a linear forecast.
+
+    A learner's overall progress is the sum of their course progress (Completed counts
+    as 100%) divided by the curriculum size. The rate is that progress divided by the
+    days since their earliest start_date; the ETA extrapolates it to 100%.
+
+    Returns:
+        (overall progress array, ETA datetime64 array with NaT where no forecast exists)
+    """
+    today = np.datetime64(today or date.today().isoformat(), "D")
+    n_learners = cohort["learner_count"]
+
+    course_progress = np.where(cohort["status"] == STATUS_CODES["Completed"], 100.0,
+                               cohort["progress"])
+    overall = np.bincount(cohort["learner"], weights=course_progress,
+                          minlength=n_learners) / max(cohort["curriculum_size"], 1)
+    overall = np.minimum(overall, 100.0)
+
+    start_days = cohort["start_date"].astype(np.int64)
+    start_days = np.where(np.isnat(cohort["start_date"]), NO_DATE, start_days)
+    first_start = np.full(n_learners, NO_DATE, dtype=np.int64)
+    np.minimum.at(first_start, cohort["learner"], start_days)
+
+    elapsed = today.astype(np.int64) - first_start
+    can_forecast = (first_start != NO_DATE) & (elapsed > 0) & (overall > 0)
+
+    eta = np.full(n_learners, np.datetime64("NaT"), dtype="datetime64[D]")
+    rate = overall[can_forecast] / elapsed[can_forecast]
+    remaining = np.ceil((100.0 - overall[can_forecast]) / rate).astype(np.int64)
+    eta[can_forecast] = today + remaining.astype("timedelta64[D]")
+    return overall, eta
+
+
+def compute_stats(learner_roots, today=None, export_dir=None):
+    """
+    Compute the cohort summary for a list of learner repositories.
+
+    Args:
+        learner_roots: List of learner repository paths
+        today: Optional ISO date used as "now" for the forecast
+        export_dir: Read the records from this export_progress.py export instead
+    """
+    cohort = load_export(export_dir) if export_dir else load_cohort(learner_roots)
+    overall, eta = forecast_completion(cohort, today)
+
+    def clean(value):
+        return None if np.isnan(value) else round(float(value), 2)
+
+    return {
+        "records": int(len(cohort["course"])),
+        "category_completion_rate": {
+            name: clean(rate) for name, rate in category_completion_rates(cohort).items()
+        },
+        "median_days_per_course": {
+            name: clean(days) for name, days in median_days_per_course(cohort).items()
+        },
+        "learners": [
+            {
+                "repo": root,
+                "overall_progress": round(float(overall[i]), 2),
+                "projected_completion": "" if np.isnat(eta[i]) else str(eta[i]),
+            }
+            for i, root in enumerate(cohort["learner_roots"])
+        ],
+    }
+
+
+def update_readme_forecast(learner_root, projected_completion):
+    """Write the projected finish date into a learner's README.md."""
+    if not projected_completion:
+        return
+    readme_path = os.path.join(learner_root, "README.md")
+    try:
+        with open(readme_path, "r", encoding="utf-8") as f:
+            readme_content = f.read()
+    except Exception as e:
+        print(f"Error reading {readme_path}: {e}")
+        return
+
+    new_content = re.sub(r'^Anticipated curriculum completion:.*$',
+                         f"Anticipated curriculum completion: {projected_completion}",
+                         readme_content, flags=re.MULTILINE)
+    if new_content != readme_content:
+        with open(readme_path, "w", encoding="utf-8") as f:
+            f.write(new_content)
+        print(f"Updated projected completion in {readme_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute OSSU cohort statistics.")
+    parser.add_argument("learners", nargs="*",
+                        help="Learner repository paths (default: current directory)")
+    parser.add_argument("--cohort", help="Directory whose subdirectories are learner repositories")
+    parser.add_argument("--export", dest="export_dir",
+                        help="Read the records from this export_progress.py export directory")
+    parser.add_argument("--json", dest="json_path", help="Write the summary to this JSON file")
+    parser.add_argument("--readme", action="store_true",
+                        help="Write each learner's projected completion into their README.md")
+    parser.add_argument("--today", help="Override today's date (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    learner_roots = collect_learner_roots(args.learners, args.cohort)
+
+    stats = compute_stats(learner_roots, args.today, args.export_dir)
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(stats, f, indent=2)
+        print(f"Wrote cohort statistics to {args.json_path}")
+    else:
+        json.dump(stats, sys.stdout, indent=2)
+        print()
+
+    if args.readme:
+        for learner in stats["learners"]:
+            update_readme_forecast(learner["repo"], learner["projected_completion"])
+
+
+if __name__ == "__main__":
+    with profile_from_argv("cohort_stats"):
+        main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Typed, validated loading of course status.json files.
+
+Every script used to json.load a status.json and pick fields out of the raw dict with
+its own .get("status", "Not Started") defaults. This module provides one compact
+CourseStatus record (using __slots__, so no per-instance __dict__) and one loader that
+fills in the generate_status_json defaults, normalizes dates to YYYY-MM-DD and
+percentages to 0-100, and raises StatusError for malformed files.
+
+Statuses are canonicalized to one of STATUSES, except with keep_status=True: the README
+updaters use that to write the status exactly as the learner spelled it, as they always
+have, and only warn about statuses outside STATUSES (e.g. "Paused").
+
+orjson is used for parsing when it is installed; otherwise the stdlib json module is.
+"""
+
+import os
+import re
+import json
+from datetime import date, datetime
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+    JSONDecodeError = json.JSONDecodeError
+
+# Valid course statuses, in progression order
+STATUSES = ("Not Started", "In Progress", "Completed")
+
+# Date layouts accepted in status.json; everything is normalized to the first one
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%d.%m.%Y")
+
+# Dates already in the canonical layout, optionally followed by a time part
+ISO_DATE = re.compile(r'(\d{4}-\d{2}-\d{2})(?:[T ].*)?', re.DOTALL)
+
+
+class StatusError(ValueError):
+    """Raised when a status.json file cannot be parsed or fails validation."""
+
+
+class CourseStatus:
+    """The contents of one course status.json file."""
+
+    __slots__ = (
+        "course_name",
+        "status",
+        "progress_percentage",
+        "start_date",
+        "completion_date",
+        "repo_link",
+        "notes",
+        "last_updated",
+    )
+
+    def __init__(self, course_name="", status="Not Started", progress_percentage=0,
+                 start_date="", completion_date="", repo_link="", notes="", last_updated=""):
+        self.course_name = course_name
+        self.status = status
+        self.progress_percentage = progress_percentage
+        self.start_date = start_date
+        self.completion_date = completion_date
+        self.repo_link = repo_link
+        self.notes = notes
+        self.last_updated = last_updated
+
+    def to_dict(self):
+        """Return the record in the status.json layout written by generate_status_json."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return f"CourseStatus({self.course_name!r}, status={self.status!r}, progress={self.progress_percentage!r})"
+
+
+def normalize_status(value):
+    """Return the canonical spelling of a status, e.g. "in progress" -> "In Progress"."""
+    if value in (None, ""):
+        return "Not Started"
+    if not isinstance(value, str):
+        raise StatusError(f"status must be a string, got {value!r}")
+    for status in STATUSES:
+        if value.strip().lower() == status.lower():
+            return status
+    raise StatusError(f"unknown status {value!r}, expected one of {', '.join(STATUSES)}")
+
+
+def normalize_percentage(value):
+    """Return a percentage as an int (or float if fractional) clamped to 0-100."""
+    if value in (None, ""):
+        return 0
+    if isinstance(value, str):
+        value = value.strip().rstrip("%").strip()
+        try:
+            value = float(value)
+        except ValueError:
+            raise StatusError(f"progress_percentage is not a number: {value!r}") from None
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise StatusError(f"progress_percentage is not a number: {value!r}")
+    value = min(max(value, 0), 100)
+    return int(value) if float(value).is_integer() else value
+
+
+def normalize_date(value, field):
+    """Return a date as YYYY-MM-DD, or "" if it is empty."""
+    if value in (None, ""):
+        return ""
+    if not isinstance(value, str):
+        raise StatusError(f"{field} must be a string, got {value!r}")
+    value = value.strip()
+    # Fast path for YYYY-MM-DD (and full timestamps, whose time part is dropped)
+    match = ISO_DATE.fullmatch(value)
+    if match:
+        try:
+            date.fromisoformat(match.group(1))
+            return match.group(1)
+        except ValueError:
+            raise StatusError(f"{field} is not a valid date: {value!r}") from None
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    raise StatusError(f"{field} is not a valid date: {value!r}")
+
+
+def written_status(value, source):
+    """Return a status as written in status.json, warning if it is not one of STATUSES."""
+    if value is None:
+        return "Not Started"
+    value = value if isinstance(value, str) else str(value)
+    if value not in STATUSES:
+        print(f"WARNING: non-standard status {value!r} in {source}, expected one of {', '.join(STATUSES)}")
+    return value
+
+
+def parse_status(raw, source="status.json", keep_status=False):
+    """
+    Parse and validate the contents of a status.json file.
+
+    Args:
+        raw: File contents as bytes or str
+        source: Name used in error messages
+        keep_status: Keep the status as written instead of canonicalizing it
+
+    Returns:
+        A CourseStatus record.
+    """
+    try:
+        data = _json_loads(raw)
+    except JSONDecodeError as e:
+        raise StatusError(f"Invalid JSON in {source}: {e}") from None
+    if not isinstance(data, dict):
+        raise StatusError(f"Invalid status file {source}: expected a JSON object")
+
+    try:
+        return CourseStatus(
+            course_name=str(data.get("course_name") or "").strip(),
+            status=(written_status(data.get("status"), source) if keep_status
+                    else normalize_status(data.get("status"))),
+            progress_percentage=normalize_percentage(data.get("progress_percentage")),
+            start_date=normalize_date(data.get("start_date"), "start_date"),
+            completion_date=normalize_date(data.get("completion_date"), "completion_date"),
+            repo_link=str(data.get("repo_link") or "").strip(),
+            notes=str(data.get("notes") or ""),
+            last_updated=normalize_date(data.get("last_updated"), "last_updated"),
+        )
+    except StatusError as e:
+        raise StatusError(f"Invalid status file {source}: {e}") from None
+
+
+def load_status(path, keep_status=False):
+    """
+    Load and validate a status.json file.
+
+    Args:
+        path: Path to the status.json file
+        keep_status: Keep the status as written instead of canonicalizing it
+
+    Returns:
+        A CourseStatus record. Raises StatusError if the file is missing or invalid.
+    """
+    try:
+        with open(path, "rb") as f:
+            raw = f.read()
+    except OSError as e:
+        raise StatusError(f"Could not read {path}: {e}") from None
+    return parse_status(raw, path, keep_status)
+
+
+def save_status(record, path):
+    """Write a CourseStatus record as status.json."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(record.to_dict(), f, indent=2)
+
+
+def find_status_files(learner_root):
+    """
+    Find the status.json files of every course directory in a learner repository.
+
+    Args:
+        learner_root: Path to the learner's tracker repository
+    """
+    status_files = []
+    try:
+        entries = sorted(os.listdir(learner_root))
+    except OSError as e:
+        print(f"Error listing {learner_root}: {e}")
+        return status_files
+
+    for entry in entries:
+        if entry in ('.git', '.github'):
+            continue
+        status_file = os.path.join(learner_root, entry, "status.json")
+        if os.path.isfile(status_file):
+            status_files.append(status_file)
+    return status_files
+
+
+def collect_learner_roots(learners, cohort=None, default=True):
+    """
+    Combine learner repository arguments with the subdirectories of a cohort directory.
+
+    Args:
+        learners: Learner repository paths given on the command line
+        cohort: Directory whose subdirectories are learner repositories
+        default: Fall back to the current directory when no repository was given
+    """
+    learner_roots = list(learners)
+    if cohort:
+        learner_roots.extend(sorted(
+            os.path.join(cohort, d) for d in os.listdir(cohort)
+            if os.path.isdir(os.path.join(cohort, d))
+        ))
+    if not learner_roots and default:
+        learner_roots = ["."]
+    return learner_roots
+
+
+def load_learner_statuses(learner_root):
+    """Load every valid status.json of a learner repository, reporting invalid ones."""
+    records = []
+    for status_file in find_status_files(learner_root):
+        try:
+            records.append(load_status(status_file))
+        except StatusError as e:
+            print(f"Error reading {status_file}: {e}")
+    return records
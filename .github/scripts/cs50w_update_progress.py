@@ -6,10 +6,14 @@ and ensures it only updates the CS50W course entry in README.md.
 """
 
 import os
-import json
 import re
 import sys
 
+from course_status import load_status, StatusError
+from readme_mmap import update_row
+from readme_shards import refresh_index, target_for
+from profiling import profile_from_argv
+
 def find_cs50w_status_file():
     """
     Find the CS50W status.json file in various possible locations.
@@ -32,18 +36,23 @@ def find_cs50w_status_file():
     print("CS50W status.json file not found in any of the expected locations.")
     return None
 
-def update_cs50w_in_readme(status_file_path):
+def update_cs50w_in_readme(status_file_path, use_mmap=False):
     """
     Update the README.md with information from the CS50W status.json file.
 
     Args:
         status_file_path: Path to the CS50W status.json file
+        use_mmap: Patch the CS50W row in place through readme_mmap instead of
+                  rewriting the whole README
     """
     print(f"Starting update process for CS50W using status file: {status_file_path}")
 
+    # In the sharded layout the CS50W row lives in its category's shard
+    readme_path = target_for("../../README.md", "CS50W")
+
     # Read the README.md file
     try:
-        with open("../../README.md", "r", encoding="utf-8") as f:
+        with open(readme_path, "r", encoding="utf-8") as f:
             readme_content = f.read()
         print("Successfully read README.md")
     except Exception as e:
@@ -83,26 +92,25 @@ def update_cs50w_in_readme(status_file_path):
                 readme_content = readme_content.replace(table, updated_table)
 
         # Save the updated README with the new column
-        with open("../../README.md", "w", encoding="utf-8") as f:
+        with open(readme_path, "w", encoding="utf-8") as f:
             f.write(readme_content)
         print("Added Progress column to README tables")
 
         # Read the updated content
-        with open("../../README.md", "r", encoding="utf-8") as f:
+        with open(readme_path, "r", encoding="utf-8") as f:
             readme_content = f.read()
 
     # Read the CS50W status.json file
     try:
-        with open(status_file_path, "r", encoding="utf-8") as f:
-            status_data = json.load(f)
+        record = load_status(status_file_path, keep_status=True)
 
         # Extract information
-        course_name = status_data.get("course_name", "")
-        status = status_data.get("status", "Not Started")
-        repo_link = status_data.get("repo_link", "")
-        progress = status_data.get("progress_percentage", 0)
-        notes = status_data.get("notes", "")
-        completion_date = status_data.get("completion_date", "")
+        course_name = record.course_name
+        status = record.status
+        repo_link = record.repo_link
+        progress = record.progress_percentage
+        notes = record.notes
+        completion_date = record.completion_date
 
         print(f"Course name: {course_name}")
         print(f"Status: {status}")
@@ -122,6 +130,20 @@ def update_cs50w_in_readme(status_file_path):
         # Prepare repository link text
         repo_text = f"[Repo]({repo_link})" if repo_link else ""
 
+        if use_mmap:
+            cells = {1: status, 2: repo_text, 3: progress_text, 5: completion_date}
+            # Keep the existing notes when status.json has none
+            if notes:
+                cells[4] = notes
+            # update_row reports rows it cannot find itself
+            result = update_row(readme_path, course_name, cells, compact=True)
+            if result is None:
+                return
+            if result != "unchanged" and readme_path != "../../README.md":
+                refresh_index("../../README.md", [readme_path])
+            print(f"SUCCESS: README.md updated successfully for CS50W! ({result})")
+            return
+
         # Define search terms specific to CS50W
         search_terms = []
 
@@ -211,28 +233,34 @@ def update_cs50w_in_readme(status_file_path):
 
         # Write the updated README
         try:
-            with open("../../README.md", "w", encoding="utf-8") as f:
+            with open(readme_path, "w", encoding="utf-8") as f:
                 f.write(readme_content)
+            if readme_path != "../../README.md":
+                refresh_index("../../README.md", [readme_path])
             print(f"SUCCESS: README.md updated successfully for CS50W!")
         except Exception as e:
             print(f"ERROR: Could not write to README.md: {e}")
 
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Invalid JSON in {status_file_path}: {e}")
+    except StatusError as e:
+        print(f"ERROR: {e}")
     except Exception as e:
         print(f"ERROR: Unexpected error processing {status_file_path}: {e}")
 
 if __name__ == "__main__":
-    # Check if a status file path was provided as an argument
-    if len(sys.argv) > 1:
-        status_file_path = sys.argv[1]
-        print(f"Using provided path: {status_file_path}")
-    else:
-        # Try to find the CS50W status.json file automatically
-        status_file_path = find_cs50w_status_file()
-
-        if not status_file_path:
-            print("ERROR: Could not find CS50W status.json file. Please provide the path as an argument.")
-            sys.exit(1)
-
-    update_cs50w_in_readme(status_file_path)
\ No newline at end of file
+    with profile_from_argv("cs50w_update_progress"):
+        use_mmap = "--mmap" in sys.argv[1:]
+        args = [arg for arg in sys.argv[1:] if arg != "--mmap"]
+
+        # Check if a status file path was provided as an argument
+        if args:
+            status_file_path = args[0]
+            print(f"Using provided path: {status_file_path}")
+        else:
+            # Try to find the CS50W status.json file automatically
+            status_file_path = find_cs50w_status_file()
+
+            if not status_file_path:
+                print("ERROR: Could not find CS50W status.json file. Please provide the path as an argument.")
+                sys.exit(1)
+
+        update_cs50w_in_readme(status_file_path, use_mmap=use_mmap)
\ No newline at end of file
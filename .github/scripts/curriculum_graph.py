@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Prerequisite graph and next-course recommendations for OSSU progress tracking.
+
+The "prerequisites" of each course in the curriculum catalog are compiled once into a DAG:
+1. Courses are put in topological order (prerequisites before the courses needing them)
+2. Each course gets a bitset of its direct prerequisites and of everything it transitively
+   depends on, stored as Python ints with one bit per course
+
+A learner's progress becomes a "completed" bitset, so "is this course eligible?" and
+"what is it blocked by?" are single bit operations, with no graph walk per learner.
+The recommendations can be written into each learner's README.md.
+"""
+
+import os
+import re
+import argparse
+
+from course_status import collect_learner_roots, load_learner_statuses
+from catalog import course_dir_name, load_curriculum, normalize_key
+from profiling import profile_from_argv
+
+# Markers around the generated recommendations section in README.md
+SECTION_START = "<!-- next-courses:start -->"
+SECTION_END = "<!-- next-courses:end -->"
+
+
+def iter_bits(mask):
+    """Yield the indexes of the set bits of a bitset, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class CurriculumGraph:
+    """A compiled prerequisite DAG with topological order and reachability bitsets."""
+
+    def __init__(self, curriculum):
+        courses = [course for category in curriculum.values() for course in category]
+        by_name = {course["name"]: course for course in courses}
+
+        for course in courses:
+            for prerequisite in course.get("prerequisites", []):
+                if prerequisite not in by_name:
+                    raise ValueError(f"Unknown prerequisite '{prerequisite}' for course '{course['name']}'")
+
+        # Kahn's algorithm, keeping curriculum order among courses that are ready together
+        remaining = {course["name"]: len(course.get("prerequisites", [])) for course in courses}
+        dependents = {course["name"]: [] for course in courses}
+        for course in courses:
+            for prerequisite in course.get("prerequisites", []):
+                dependents[prerequisite].append(course["name"])
+
+        ready = [name for name, count in remaining.items() if count == 0]
+        order = []
+        while ready:
+            name = ready.pop(0)
+            order.append(name)
+            for dependent in dependents[name]:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+
+        if len(order) != len(courses):
+            cycle = sorted(name for name, count in remaining.items() if count > 0)
+            raise ValueError(f"Prerequisite cycle between courses: {', '.join(cycle)}")
+
+        self.courses = [by_name[name] for name in order]
+        self.index = {name: i for i, name in enumerate(order)}
+
+        # Direct prerequisites, and transitive ones filled in topological order
+        self.requires = [0] * len(order)
+        self.requires_all = [0] * len(order)
+        for i, course in enumerate(self.courses):
+            for prerequisite in course.get("prerequisites", []):
+                p = self.index[prerequisite]
+                self.requires[i] |= 1 << p
+                self.requires_all[i] |= (1 << p) | self.requires_all[p]
+
+        # Every name, full name, alias and directory name -> bit, so records map to bits
+        # with one dict lookup instead of a catalog resolve per record
+        self.bit_of = {}
+        for i, course in enumerate(self.courses):
+            for key in [course["name"], course["full_name"], course_dir_name(course), *course.get("aliases", [])]:
+                self.bit_of.setdefault(normalize_key(key), 1 << i)
+        self.all_courses = (1 << len(order)) - 1
+
+    def mask_of(self, course_names):
+        """Return the bitset of the given courses, matched by any catalog name or alias."""
+        mask = 0
+        for course_name in course_names:
+            mask |= self.bit_of.get(normalize_key(course_name), 0)
+        return mask
+
+    def is_eligible(self, i, completed):
+        """Return True if every prerequisite of course i is in the completed bitset."""
+        return self.requires[i] & ~completed == 0
+
+    def blocked_by(self, i, completed):
+        """Return the bitset of all (transitive) prerequisites of course i not yet completed."""
+        return self.requires_all[i] & ~completed
+
+    def names(self, mask):
+        """Return the course names in a bitset, in topological order."""
+        return [self.courses[i]["name"] for i in iter_bits(mask)]
+
+    def recommend(self, records):
+        """
+        Split a learner's untaken courses into eligible and blocked ones.
+
+        Args:
+            records: The learner's CourseStatus records
+
+        Returns:
+            (eligible courses, [(blocked course, [missing prerequisite names])])
+        """
+        completed = self.mask_of(r.course_name for r in records if r.status == "Completed")
+        started = self.mask_of(r.course_name for r in records if r.status != "Not Started")
+
+        eligible, blocked = [], []
+        for i in iter_bits(self.all_courses & ~(completed | started)):
+            course = self.courses[i]
+            if self.is_eligible(i, completed):
+                eligible.append(course)
+            else:
+                blocked.append((course, self.names(self.blocked_by(i, completed))))
+        return eligible, blocked
+
+
+def format_recommendations(eligible, blocked):
+    """Render the recommendations as a README section."""
+    lines = [SECTION_START, "### Next Courses"]
+    if eligible:
+        lines.extend(f"- [{course['full_name']}]({course['url']})" for course in eligible)
+    else:
+        lines.append("- No courses are currently eligible")
+    if blocked:
+        lines.append("")
+        lines.append("Blocked by prerequisites:")
+        lines.extend(f"- {course['full_name']} (needs: {', '.join(missing)})" for course, missing in blocked)
+    lines.append(SECTION_END)
+    return "\n".join(lines)
+
+
+def update_readme_recommendations(learner_root, section):
+    """Replace (or insert before "## Resources") the recommendations section of a README."""
+    readme_path = os.path.join(learner_root, "README.md")
+    try:
+        with open(readme_path, "r", encoding="utf-8") as f:
+            readme_content = f.read()
+    except Exception as e:
+        print(f"Error reading {readme_path}: {e}")
+        return
+
+    pattern = re.escape(SECTION_START) + r'.*?' + re.escape(SECTION_END)
+    if re.search(pattern, readme_content, re.DOTALL):
+        new_content = re.sub(pattern, lambda m: section, readme_content, flags=re.DOTALL)
+    elif "\n## Resources" in readme_content:
+        new_content = readme_content.replace("\n## Resources", f"\n{section}\n\n## Resources", 1)
+    else:
+        new_content = readme_content.rstrip("\n") + f"\n\n{section}\n"
+
+    if new_content != readme_content:
+        with open(readme_path, "w", encoding="utf-8") as f:
+            f.write(new_content)
+        print(f"Updated next courses in {readme_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recommend the next OSSU courses to take.")
+    parser.add_argument("learners", nargs="*",
+                        help="Learner repository paths (default: current directory)")
+    parser.add_argument("--cohort", help="Directory whose subdirectories are learner repositories")
+    parser.add_argument("--readme", action="store_true",
+                        help="Write the recommendations into each learner's README.md")
+    args = parser.parse_args()
+
+    learner_roots = collect_learner_roots(args.learners, args.cohort)
+
+    graph = CurriculumGraph(load_curriculum())
+    for learner_root in learner_roots:
+        eligible, blocked = graph.recommend(load_learner_statuses(learner_root))
+        section = format_recommendations(eligible, blocked)
+        if args.readme:
+            update_readme_recommendations(learner_root, section)
+        else:
+            print(f"{learner_root}:")
+            print(section)
+
+
+if __name__ == "__main__":
+    with profile_from_argv("curriculum_graph"):
+        main()
@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Columnar export of OSSU progress data for analytics.
+
+This script writes the status.json records of one or more learner repositories to:
+1. A CSV file (always, for portability)
+2. A binary columnar file (Parquet or Arrow IPC) when pyarrow is installed
+
+Records are streamed in fixed-size chunks so memory does not grow with cohort size.
+Exports are incremental by default: a manifest remembers the hash of every exported
+status.json, so a nightly run only appends the records that changed since the last run.
+"""
+
+import os
+import csv
+import json
+import hashlib
+import argparse
+from datetime import datetime
+
+from course_status import collect_learner_roots, find_status_files, parse_status, StatusError
+from profiling import profile_from_argv
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Column order of every export
+COLUMNS = [
+    "learner_repo",
+    "course_dir",
+    "course_name",
+    "status",
+    "progress_percentage",
+    "start_date",
+    "completion_date",
+    "repo_link",
+    "notes",
+    "last_updated",
+    "exported_at",
+]
+
+CSV_NAME = "status_records.csv"
+MANIFEST_NAME = "manifest.json"
+
+
+def iter_status_files(learner_roots):
+    """Yield (learner_root, course_dir, status_file) for every course in the given repos."""
+    for learner_root in learner_roots:
+        for status_file in find_status_files(learner_root):
+            yield learner_root, os.path.basename(os.path.dirname(status_file)), status_file
+
+
+def iter_changed_records(learner_roots, manifest, exported_at):
+    """
+    Yield export rows for status files whose content changed since the last export.
+
+    Args:
+        learner_roots: List of learner repository paths
+        manifest: Dict of status file path -> content hash, updated in place
+        exported_at: Timestamp stored in the exported_at column
+    """
+    for learner_root, course_dir, status_file in iter_status_files(learner_roots):
+        try:
+            with open(status_file, "rb") as f:
+                raw = f.read()
+            digest = hashlib.sha1(raw).hexdigest()
+            if manifest.get(status_file) == digest:
+                continue
+            record = parse_status(raw, status_file)
+        except (OSError, StatusError) as e:
+            print(f"Error reading {status_file}: {e}")
+            continue
+
+        manifest[status_file] = digest
+        row = record.to_dict()
+        row["progress_percentage"] = float(row["progress_percentage"])
+        row.update(learner_repo=learner_root, course_dir=course_dir, exported_at=exported_at)
+        yield row
+
+
+def iter_chunks(rows, chunk_size):
+    """Group an iterable of rows into lists of at most chunk_size rows."""
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def arrow_schema():
+    """Return the Arrow schema matching COLUMNS."""
+    fields = [(name, pa.string()) for name in COLUMNS]
+    fields[COLUMNS.index("progress_percentage")] = ("progress_percentage", pa.float64())
+    return pa.schema(fields)
+
+
+class BinaryWriter:
+    """Write chunks to one Parquet or Arrow IPC part file per export run."""
+
+    def __init__(self, export_dir, binary_format, run_id):
+        self.schema = arrow_schema()
+        extension = "parquet" if binary_format == "parquet" else "arrow"
+        self.path = os.path.join(export_dir, f"status_records-{run_id}.{extension}")
+        self.sink = None
+        if binary_format == "parquet":
+            self.writer = pq.ParquetWriter(self.path, self.schema)
+        else:
+            self.sink = pa.OSFile(self.path, "wb")
+            self.writer = pa.ipc.new_file(self.sink, self.schema)
+
+    def write_chunk(self, chunk):
+        columns = {name: [row[name] for row in chunk] for name in COLUMNS}
+        self.writer.write_table(pa.Table.from_pydict(columns, schema=self.schema))
+
+    def close(self):
+        self.writer.close()
+        if self.sink is not None:
+            self.sink.close()
+
+
+def load_manifest(manifest_path):
+    """Load the export manifest, or an empty one if there is none yet."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        print(f"Error reading {manifest_path}, starting a full export: {e}")
+        return {}
+
+
+def export_progress(learner_roots, export_dir, binary_format="parquet", chunk_size=5000, full=False):
+    """
+    Export status records to CSV and (optionally) a binary columnar format.
+
+    Args:
+        learner_roots: List of learner repository paths
+        export_dir: Directory holding the CSV, binary part files and manifest
+        binary_format: "parquet", "arrow" or "none"
+        chunk_size: Number of records buffered before each write
+        full: Ignore the manifest and rewrite the export from scratch
+
+    Returns:
+        The number of records exported.
+    """
+    os.makedirs(export_dir, exist_ok=True)
+    csv_path = os.path.join(export_dir, CSV_NAME)
+    manifest_path = os.path.join(export_dir, MANIFEST_NAME)
+
+    if full:
+        manifest = {}
+        for name in os.listdir(export_dir):
+            if name == CSV_NAME or name.startswith("status_records-"):
+                os.remove(os.path.join(export_dir, name))
+    else:
+        manifest = load_manifest(manifest_path)
+
+    if binary_format != "none" and pa is None:
+        print("pyarrow is not installed, exporting CSV only")
+        binary_format = "none"
+
+    now = datetime.now()
+    exported_at = now.strftime("%Y-%m-%dT%H:%M:%S")
+    run_id = now.strftime("%Y%m%d%H%M%S%f")
+
+    write_header = not os.path.exists(csv_path)
+    binary_writer = None
+    count = 0
+
+    with open(csv_path, "a", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=COLUMNS)
+        if write_header:
+            writer.writeheader()
+
+        rows = iter_changed_records(learner_roots, manifest, exported_at)
+        try:
+            for chunk in iter_chunks(rows, chunk_size):
+                writer.writerows(chunk)
+                if binary_format != "none":
+                    if binary_writer is None:
+                        binary_writer = BinaryWriter(export_dir, binary_format, run_id)
+                    binary_writer.write_chunk(chunk)
+                count += len(chunk)
+        finally:
+            if binary_writer is not None:
+                binary_writer.close()
+
+    # Only record the new hashes once the data they describe has been written
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+    print(f"Exported {count} changed records to {export_dir}")
+    if binary_writer is not None:
+        print(f"Binary export written to {binary_writer.path}")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export OSSU progress data in columnar form.")
+    parser.add_argument("learners", nargs="*",
+                        help="Learner repository paths (default: current directory)")
+    parser.add_argument("--cohort", help="Directory whose subdirectories are learner repositories")
+    parser.add_argument("--out", default="export", help="Export directory (default: export)")
+    parser.add_argument("--format", dest="binary_format", default="parquet",
+                        choices=["parquet", "arrow", "none"],
+                        help="Binary columnar format written next to the CSV (default: parquet)")
+    parser.add_argument("--chunk-size", type=int, default=5000,
+                        help="Records buffered per write (default: 5000)")
+    parser.add_argument("--full", action="store_true",
+                        help="Rewrite the whole export instead of appending changes")
+    args = parser.parse_args()
+
+    learner_roots = collect_learner_roots(args.learners, args.cohort)
+
+    export_progress(learner_roots, args.out, args.binary_format, args.chunk_size, args.full)
+
+
+if __name__ == "__main__":
+    with profile_from_argv("export_progress"):
+        main()
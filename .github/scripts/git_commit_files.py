@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Commit a fixed set of files with git plumbing.
+
+The workflows used to run `git add`, `git diff --quiet` and `git commit`, which
+refresh the index and scan the whole working tree. This script instead:
+1. Hashes only the given files into blobs (git hash-object -w --stdin-paths)
+2. Compares them with the entries of their directories in the parent commit and exits
+   if none changed
+3. Rebuilds only the trees along the changed paths (ls-tree, mktree), reusing every
+   other tree of the parent commit as it is
+4. Writes the commit with commit-tree and moves the branch with update-ref
+
+A listed file that no longer exists is deleted from the tree, and a listed directory
+stands for every file under it, both on disk and in the parent commit, so files removed
+from it are deleted too. Dot-files inside listed directories (such as the readme_mmap
+index sidecars) are skipped.
+
+Nothing here stats the rest of the working tree or reads the whole tree of the parent
+commit, so the cost depends on the number and depth of the changed paths, not on the
+size of the repository. Works against bare repositories too:
+
+    python .github/scripts/git_commit_files.py -m "Update progress in README" README.md progress
+    python .github/scripts/git_commit_files.py --git-dir remote.git --work-tree out -m "..." out/README.md
+    python .github/scripts/git_commit_files.py --self-test
+"""
+
+import os
+import sys
+import argparse
+import tempfile
+import posixpath
+import subprocess
+
+from profiling import profile_from_argv
+
+# Mode and type of a subtree entry in mktree input
+TREE_MODE = "040000"
+
+
+def git(git_dir, *args, env=None, cwd=None, input=None):
+    """Run a git command and return its stripped stdout."""
+    command = ["git"]
+    if git_dir:
+        command.append(f"--git-dir={git_dir}")
+    command.extend(args)
+    result = subprocess.run(command, check=True, capture_output=True, text=True, env=env, cwd=cwd,
+                            input=input)
+    return result.stdout.strip()
+
+
+def resolve_parent(git_dir, branch):
+    """Return the commit the branch points to, or None for an unborn branch."""
+    try:
+        return git(git_dir, "rev-parse", "--verify", "--quiet", f"refs/heads/{branch}^{{commit}}")
+    except subprocess.CalledProcessError:
+        return None
+
+
+def current_branch(git_dir):
+    """Return the branch HEAD points to."""
+    ref = git(git_dir, "symbolic-ref", "HEAD")
+    return ref[len("refs/heads/"):]
+
+
+def tree_entries(git_dir, parent, directory):
+    """
+    Return the entries of one directory of the parent commit.
+
+    Returns:
+        {name: (mode, type, object)}, empty if the directory does not exist.
+    """
+    if parent is None:
+        return {}
+    try:
+        output = git(git_dir, "ls-tree", "-z", f"{parent}:{directory}")
+    except subprocess.CalledProcessError:
+        return {}
+    entries = {}
+    for line in filter(None, output.split("\0")):
+        info, name = line.split("\t", 1)
+        mode, kind, obj = info.split(" ")
+        entries[name] = (mode, kind, obj)
+    return entries
+
+
+def expand_paths(git_dir, parent, work_tree, files):
+    """
+    Expand the command line paths into files relative to the work tree.
+
+    Directories are replaced by every file under them on disk (dot-files skipped) and
+    every file under them in the parent commit.
+
+    Returns:
+        List of (repository path, absolute path), without duplicates.
+    """
+    expanded = {}
+    for f in files:
+        full_path = os.path.abspath(f)
+        path = os.path.relpath(full_path, work_tree).replace(os.sep, "/")
+        kind = None
+        if parent is not None and not os.path.isfile(full_path):
+            directory, name = posixpath.split(path)
+            kind = tree_entries(git_dir, parent, directory).get(name, (None, None, None))[1]
+        if not os.path.isdir(full_path) and kind != "tree":
+            expanded[path] = full_path
+            continue
+
+        for root, dirs, names in os.walk(full_path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            for name in sorted(names):
+                if not name.startswith("."):
+                    file_path = os.path.join(root, name)
+                    expanded[os.path.relpath(file_path, work_tree).replace(os.sep, "/")] = file_path
+        if kind == "tree":
+            output = git(git_dir, "ls-tree", "-r", "-z", "--name-only", "--full-tree", parent, "--", path)
+            for tracked in filter(None, output.split("\0")):
+                expanded.setdefault(tracked, os.path.join(work_tree, *tracked.split("/")))
+    return list(expanded.items())
+
+
+def build_trees(git_dir, parent, changes):
+    """
+    Write the trees along the changed paths with mktree.
+
+    Args:
+        changes: {path: (mode, blob), or None to delete the path}
+
+    Returns:
+        The hash of the new root tree.
+    """
+    # Every directory holding a change, plus all of its ancestors
+    directories = {""}
+    for path in changes:
+        directory = posixpath.dirname(path)
+        while directory:
+            directories.add(directory)
+            directory = posixpath.dirname(directory)
+
+    new_trees = {}
+    for directory in sorted(directories, key=lambda d: d.count("/") + bool(d), reverse=True):
+        entries = tree_entries(git_dir, parent, directory)
+        for path, change in changes.items():
+            if posixpath.dirname(path) == directory:
+                name = posixpath.basename(path)
+                if change is None:
+                    entries.pop(name, None)
+                else:
+                    entries[name] = (change[0], "blob", change[1])
+        for subdirectory, tree in new_trees.items():
+            if subdirectory and posixpath.dirname(subdirectory) == directory:
+                name = posixpath.basename(subdirectory)
+                if tree is None:
+                    entries.pop(name, None)
+                else:
+                    entries[name] = (TREE_MODE, "tree", tree)
+
+        if not entries and directory:
+            # Git has no empty directories, so a tree left empty is removed from its parent
+            new_trees[directory] = None
+            continue
+        listing = "".join(f"{mode} {kind} {obj}\t{name}\0" for name, (mode, kind, obj) in entries.items())
+        new_trees[directory] = git(git_dir, "mktree", "-z", input=listing)
+    return new_trees[""]
+
+
+def commit_files(files, message, git_dir=None, work_tree=None, branch=None):
+    """
+    Write the given files into a single commit on a branch.
+
+    Args:
+        files: Paths of the files or directories to commit, relative to the current directory
+        message: Commit message
+        git_dir: Repository to commit to (default: the one git finds from the cwd)
+        work_tree: Top of the tree the files belong to (default: the repository top level)
+        branch: Branch to update (default: the branch HEAD points to)
+
+    Returns:
+        The new commit hash, or None if every file matched the parent commit.
+    """
+    if git_dir:
+        git_dir = os.path.abspath(git_dir)
+    branch = branch or current_branch(git_dir)
+    parent = resolve_parent(git_dir, branch)
+
+    if work_tree is None:
+        work_tree = git(git_dir, "rev-parse", "--show-toplevel")
+    work_tree = os.path.abspath(work_tree)
+    paths = expand_paths(git_dir, parent, work_tree, files)
+
+    present = [(path, full_path) for path, full_path in paths if os.path.isfile(full_path)]
+    blobs = []
+    if present:
+        blobs = git(git_dir, "hash-object", "-w", "--stdin-paths",
+                    input="".join(full_path + "\n" for _, full_path in present)).split("\n")
+    blob_of = {path: blob for (path, _), blob in zip(present, blobs)}
+
+    # Compare with the parent's entries, listing each directory once
+    directory_entries = {}
+    changes = {}
+    for path, full_path in paths:
+        directory, name = posixpath.split(path)
+        if directory not in directory_entries:
+            directory_entries[directory] = tree_entries(git_dir, parent, directory)
+        previous = directory_entries[directory].get(name)
+        if path not in blob_of:
+            if previous is not None:
+                changes[path] = None
+            continue
+        if previous is not None and previous[1] == "blob":
+            mode = previous[0]
+        else:
+            mode = "100755" if os.access(full_path, os.X_OK) else "100644"
+        if previous != (mode, "blob", blob_of[path]):
+            changes[path] = (mode, blob_of[path])
+
+    if not changes:
+        print("No changes to commit")
+        return None
+
+    tree = build_trees(git_dir, parent, changes)
+    commit_args = ["commit-tree", tree, "-m", message]
+    if parent is not None:
+        commit_args.extend(["-p", parent])
+    commit = git(git_dir, *commit_args)
+
+    # Compare-and-swap so a concurrent update of the branch is not overwritten
+    git(git_dir, "update-ref", "-m", f"commit: {message}", f"refs/heads/{branch}", commit, parent or "0" * 40)
+
+    # Keep the real index (if any) in step with the new commit for the changed paths
+    if git(git_dir, "rev-parse", "--is-bare-repository") == "false":
+        cacheinfo = []
+        removed = []
+        for path, change in changes.items():
+            if change is None:
+                removed.append(path)
+            else:
+                cacheinfo.extend(["--cacheinfo", f"{change[0]},{change[1]},{path}"])
+        if cacheinfo:
+            git(git_dir, "update-index", "--add", *cacheinfo, cwd=work_tree)
+        if removed:
+            git(git_dir, "update-index", "--force-remove", "--", *removed, cwd=work_tree)
+
+    deleted = sum(1 for change in changes.values() if change is None)
+    print(f"Committed {len(changes) - deleted} file(s) and {deleted} deletion(s) as {commit[:7]} on {branch}")
+    return commit
+
+
+def self_test():
+    """
+    Exercise commit_files against a throwaway bare repository.
+
+    Checks a first commit, the skip when nothing changed, an update in a nested
+    directory that keeps the sibling trees, and the deletion of files removed from a
+    listed directory.
+    """
+    for variable in ("GIT_AUTHOR_NAME", "GIT_COMMITTER_NAME"):
+        os.environ.setdefault(variable, "git_commit_files self-test")
+    for variable in ("GIT_AUTHOR_EMAIL", "GIT_COMMITTER_EMAIL"):
+        os.environ.setdefault(variable, "self-test@example.com")
+
+    def write(path, text):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text)
+
+    def listing(repo, commit):
+        return git(repo, "ls-tree", "-r", "--name-only", commit).split("\n")
+
+    with tempfile.TemporaryDirectory(prefix="git-commit-files-") as root:
+        repo = os.path.join(root, "remote.git")
+        out = os.path.join(root, "out")
+        git(None, "init", "--quiet", "--bare", repo)
+        git(repo, "symbolic-ref", "HEAD", "refs/heads/main")
+
+        write(os.path.join(out, "README.md"), "# Tracker\n")
+        write(os.path.join(out, "progress", "core-math.md"), "| Course |\n")
+        write(os.path.join(out, "progress", "core-systems.md"), "| Course |\n")
+        write(os.path.join(out, "progress", ".core-math.md.index"), "ignored")
+        write(os.path.join(out, "cs50", "status.json"), "{}\n")
+        first = commit_files([os.path.join(out, name) for name in ("README.md", "progress", "cs50")],
+                             "Initial", repo, out)
+        assert listing(repo, first) == ["README.md", "cs50/status.json", "progress/core-math.md",
+                                        "progress/core-systems.md"], listing(repo, first)
+
+        assert commit_files([os.path.join(out, "README.md")], "Unchanged", repo, out) is None
+
+        write(os.path.join(out, "progress", "core-math.md"), "| Course | Status |\n")
+        second = commit_files([os.path.join(out, "progress", "core-math.md")], "Update", repo, out)
+        assert git(repo, "rev-parse", f"{second}^") == first
+        assert git(repo, "rev-parse", f"{second}:cs50") == git(repo, "rev-parse", f"{first}:cs50")
+        assert git(repo, "show", f"{second}:progress/core-math.md") == "| Course | Status |"
+
+        os.remove(os.path.join(out, "progress", "core-systems.md"))
+        third = commit_files([os.path.join(out, "README.md"), os.path.join(out, "progress")],
+                             "Delete", repo, out)
+        assert listing(repo, third) == ["README.md", "cs50/status.json", "progress/core-math.md"]
+
+        for name in os.listdir(os.path.join(out, "progress")):
+            os.remove(os.path.join(out, "progress", name))
+        os.rmdir(os.path.join(out, "progress"))
+        fourth = commit_files([os.path.join(out, "progress")], "Remove directory", repo, out)
+        assert listing(repo, fourth) == ["README.md", "cs50/status.json"]
+        assert git(repo, "rev-parse", "refs/heads/main") == fourth
+
+    print("Self-test passed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Commit files with git plumbing.")
+    parser.add_argument("files", nargs="*", help="Files or directories to commit")
+    parser.add_argument("-m", "--message", help="Commit message")
+    parser.add_argument("--git-dir", help="Repository to commit to (may be bare)")
+    parser.add_argument("--work-tree", help="Top of the tree the files belong to (default: repository top level)")
+    parser.add_argument("--branch", help="Branch to update (default: current branch)")
+    parser.add_argument("--self-test", action="store_true",
+                        help="Check the script against a temporary bare repository and exit")
+    args = parser.parse_args()
+
+    try:
+        if args.self_test:
+            self_test()
+            return
+        if not args.files or not args.message:
+            parser.error("files and -m/--message are required")
+        commit_files(args.files, args.message, args.git_dir, args.work_tree, args.branch)
+    except subprocess.CalledProcessError as e:
+        print(f"ERROR: {' '.join(e.cmd)} failed: {e.stderr.strip()}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    with profile_from_argv("git_commit_files"):
+        main()
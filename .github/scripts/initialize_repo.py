@@ -4,62 +4,33 @@ This script initializes the OSSU tracker repository structure by:
 1. Creating directories for each course
 2. Generating a README.md file for each course
 3. Creating a status.json file for each course
+4. Recording the template state template_sync.py needs to update the READMEs later
 """
 
 import os
 import json
 import shutil
 from datetime import datetime
-import requests
 from pathlib import Path
 
-# OSSU curriculum data - you can extend this as needed
-CURRICULUM = {
-    "Introduction to Computer Science": [
-        {
-            "name": "CS50",
-            "full_name": "CS50's Introduction to Computer Science",
-            "url": "https://cs50.harvard.edu/x",
-            "institution": "Harvard University",
-            "platform": "edX",
-            "category": "Introduction to Computer Science"
-        },
-        {
-            "name": "CS50W",
-            "full_name": "CS50's Web Programming with Python and JavaScript",
-            "url": "https://cs50.harvard.edu/web/",
-            "institution": "Harvard University",
-            "platform": "edX",
-            "category": "Introduction to Computer Science"
-        }
-    ],
-    "Core Programming": [
-        {
-            "name": "How to Code - Simple Data",
-            "full_name": "How to Code - Simple Data",
-            "url": "https://www.edx.org/course/how-to-code-simple-data",
-            "institution": "University of British Columbia",
-            "platform": "edX",
-            "category": "Core Programming"
-        },
-        {
-            "name": "How to Code - Complex Data",
-            "full_name": "How to Code - Complex Data",
-            "url": "https://www.edx.org/course/how-to-code-complex-data",
-            "institution": "University of British Columbia",
-            "platform": "edX",
-            "category": "Core Programming"
-        },
-        {
-            "name": "Programming Languages A",
-            "full_name": "Programming Languages, Part A",
-            "url": "https://www.coursera.org/learn/programming-languages",
-            "institution": "University of Washington",
-            "platform": "Coursera",
-            "category": "Core Programming"
-        }
-    ]
-}
+from catalog import CATALOG_PATH, load_curriculum
+from profiling import profile_from_argv
+from template_sync import save_state
+
+# OSSU curriculum data - edit .github/data/curriculum.json to extend it
+CURRICULUM = load_curriculum()
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# update_progress.py and the modules it imports, directly or through each other
+UPDATER_SCRIPTS = [
+    "update_progress.py",
+    "course_status.py",
+    "readme_mmap.py",
+    "readme_shards.py",
+    "catalog.py",
+    "profiling.py",
+]
 
 def create_directory_if_not_exists(path):
     """Create a directory if it does not exist."""
@@ -110,6 +81,9 @@ def generate_course_readme(course, output_path):
     readme_path = os.path.join(output_path, "README.md")
     with open(readme_path, 'w') as f:
         f.write(content)
+
+    # Record the rendering so template_sync.py can merge later template changes
+    save_state(output_path, template, course)
     
     print(f"Generated README.md for {course['name']}")
 
@@ -136,18 +110,24 @@ def setup_github_directory():
     """Set up the .github directory structure."""
     github_dir = ".github"
     scripts_dir = os.path.join(github_dir, "scripts")
+    data_dir = os.path.join(github_dir, "data")
     templates_dir = os.path.join(github_dir, "templates")
     workflows_dir = os.path.join(github_dir, "workflows")
     
     # Create directories
-    for directory in [github_dir, scripts_dir, templates_dir, workflows_dir]:
+    for directory in [github_dir, scripts_dir, data_dir, templates_dir, workflows_dir]:
         create_directory_if_not_exists(directory)
     
     # Copy files to appropriate locations
-    # Update progress script
-    script_path = os.path.join(scripts_dir, "update_progress.py")
-    shutil.copyfile("update_progress.py", script_path)
-    os.chmod(script_path, 0o755)  # Make executable
+    # Update progress script, the modules it imports and the catalog they read
+    copies = [(os.path.join(SCRIPT_DIR, name), os.path.join(scripts_dir, name)) for name in UPDATER_SCRIPTS]
+    copies.append((CATALOG_PATH, os.path.join(data_dir, "curriculum.json")))
+    for source, destination in copies:
+        # Nothing to copy when initializing the repository the scripts live in
+        if os.path.exists(destination) and os.path.samefile(source, destination):
+            continue
+        shutil.copyfile(source, destination)
+    os.chmod(os.path.join(scripts_dir, "update_progress.py"), 0o755)  # Make executable
     
     # Course README template
     with open(os.path.join(templates_dir, "course_readme_template.md"), 'w') as f:
@@ -190,4 +170,5 @@ def initialize_repo():
     print("3. Start working on your first course!")
 
 if __name__ == "__main__":
-    initialize_repo()
\ No newline at end of file
+    with profile_from_argv("initialize_repo"):
+        initialize_repo()
\ No newline at end of file
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+On-demand profiling for the tracker scripts.
+
+Every entry point wraps its __main__ block in profile_from_argv(), which removes a
+"--profile DIR" option from sys.argv before the script parses its own arguments:
+
+    python .github/scripts/update_progress.py --profile profile-out
+
+With the option, the run writes to DIR:
+1. <name>-<time>.pstats and .pstats.txt: cProfile data and a cumulative-time listing
+2. <name>-<time>.collapsed: sampled stacks in collapsed format ("a;b;c count"), ready
+   for flamegraph.pl, speedscope or inferno
+3. <name>-<time>.tracemalloc.txt: the top allocation sites at the end of the run
+
+Without it, profile_from_argv() only scans sys.argv and returns a no-op context,
+so the option can stay available in production workflows. The profiler modules are
+only imported once profiling starts, since every updater imports this module.
+
+Only the profiled process is measured. Scripts that fan work out to a process pool
+(bulk_tracker_update.py, template_sync.py) check profiling_active() and run the
+work in-process instead, so the workers show up in the profile.
+"""
+
+import os
+import sys
+from contextlib import nullcontext
+
+# Seconds between stack samples for the collapsed-stack output
+SAMPLE_INTERVAL = 0.005
+
+# Number of allocation sites listed in the tracemalloc report
+TOP_ALLOCATIONS = 25
+
+# The Profiler of the current run, if any
+_active_profiler = None
+
+
+def pop_profile_option(argv=None):
+    """
+    Remove "--profile DIR" or "--profile=DIR" from argv and return DIR.
+
+    Exits with status 2 if the option is given without a directory, so the
+    script never sees a stray "--profile" as one of its own arguments.
+
+    Returns:
+        The output directory, or None if profiling was not requested.
+    """
+    argv = sys.argv if argv is None else argv
+    for i, arg in enumerate(argv[1:], 1):
+        if arg == "--profile":
+            profile_dir = argv[i + 1] if i + 1 < len(argv) else ""
+            del argv[i:i + 2]
+        elif arg.startswith("--profile="):
+            profile_dir = arg.split("=", 1)[1]
+            del argv[i]
+        else:
+            continue
+        if not profile_dir or profile_dir.startswith("-"):
+            print(f"ERROR: --profile needs an output directory (usage: {os.path.basename(argv[0])} --profile DIR ...)",
+                  file=sys.stderr)
+            sys.exit(2)
+        return profile_dir
+    return None
+
+
+def profiling_active():
+    """Return True while a Profiler is collecting data in this process."""
+    return _active_profiler is not None
+
+
+class StackSampler:
+    """Sample the stack of one thread at a fixed interval and count collapsed stacks."""
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        import threading
+        from collections import Counter
+
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+    def stop(self):
+        self.stopped.set()
+        self.thread.join()
+
+
+class Profiler:
+    """Context manager collecting cProfile, sampled stack and tracemalloc data for a run."""
+
+    def __init__(self, profile_dir, name):
+        self.profile_dir = profile_dir
+        self.name = name
+
+    def __enter__(self):
+        import cProfile
+        import threading
+        import tracemalloc
+        from datetime import datetime
+
+        os.makedirs(self.profile_dir, exist_ok=True)
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        self.base = os.path.join(self.profile_dir, f"{self.name}-{stamp}")
+
+        tracemalloc.start()
+        self.sampler = StackSampler(threading.get_ident())
+        self.sampler.start()
+        self.profiler = cProfile.Profile()
+        self.profiler.enable()
+
+        global _active_profiler
+        _active_profiler = self
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        import pstats
+        import tracemalloc
+
+        global _active_profiler
+        _active_profiler = None
+        self.profiler.disable()
+        self.sampler.stop()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+
+        self.profiler.dump_stats(f"{self.base}.pstats")
+        with open(f"{self.base}.pstats.txt", "w", encoding="utf-8") as f:
+            pstats.Stats(self.profiler, stream=f).sort_stats("cumulative").print_stats(50)
+
+        with open(f"{self.base}.collapsed", "w", encoding="utf-8") as f:
+            for stack, count in self.sampler.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+        ])
+        with open(f"{self.base}.tracemalloc.txt", "w", encoding="utf-8") as f:
+            for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]:
+                f.write(f"{stat}\n")
+
+        print(f"Profile written to {self.base}.*", file=sys.stderr)
+        return False
+
+
+def profile_from_argv(name):
+    """
+    Return a profiling context if "--profile DIR" was passed, else a no-op context.
+
+    Args:
+        name: Prefix of the output files, usually the script name
+    """
+    profile_dir = pop_profile_option()
+    if profile_dir is None:
+        return nullcontext()
+    return Profiler(profile_dir, name)
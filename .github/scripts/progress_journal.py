@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Append-only progress journal for OSSU courses.
+
+Small progress changes are appended as events to <course>/journal.jsonl instead of
+rewriting status.json each time:
+
+    python .github/scripts/progress_journal.py log cs50 --week 3 --done
+    python .github/scripts/progress_journal.py log cs50 --progress 40 --note "Finished pset 3"
+
+Compaction folds the journal into status.json (same layout as generate_status_json
+in initialize_repo.py) and the course README's Progress Tracker, then truncates the
+journal. It runs on demand (`compact`) or automatically once a journal reaches the
+event threshold. Because journal.jsonl does not match the update workflow paths,
+logging an event does not trigger a workflow run; only compaction does.
+"""
+
+import os
+import re
+import json
+import argparse
+from datetime import datetime
+
+from catalog import resolve_course
+from course_status import (CourseStatus, StatusError, STATUSES, load_status, normalize_percentage,
+                           normalize_status, save_status)
+from profiling import profile_from_argv
+
+JOURNAL_NAME = "journal.jsonl"
+
+# Number of journal events that triggers an automatic compaction after `log`
+DEFAULT_THRESHOLD = 20
+
+
+def append_event(course_dir, event):
+    """
+    Append one event to a course journal.
+
+    Args:
+        course_dir: Path to the course directory
+        event: Dict describing the change (see build_event)
+
+    Returns:
+        The number of events now in the journal.
+    """
+    journal_path = os.path.join(course_dir, JOURNAL_NAME)
+    with open(journal_path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(event) + "\n")
+
+    with open(journal_path, "rb") as f:
+        return sum(1 for _ in f)
+
+
+def read_events(course_dir):
+    """Read all events of a course journal, skipping malformed lines."""
+    journal_path = os.path.join(course_dir, JOURNAL_NAME)
+    events = []
+    if not os.path.exists(journal_path):
+        return events
+
+    with open(journal_path, "r", encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                events.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                print(f"Skipping malformed event on line {line_number} of {journal_path}: {e}")
+    return events
+
+
+def load_course_status(course_dir):
+    """Load a course's status.json, or a default record if it does not exist yet."""
+    status_path = os.path.join(course_dir, "status.json")
+    if os.path.exists(status_path):
+        return load_status(status_path)
+    # update_progress.py skips records without a course name, so take it from the catalog
+    course = resolve_course(os.path.basename(os.path.normpath(course_dir)))
+    return CourseStatus(course_name=course["full_name"] if course else "")
+
+
+def update_week_row(readme_content, week, status, date):
+    """
+    Update the Status and Completion Date cells of a Progress Tracker row.
+
+    The Week/Module and Notes cells are kept as they are.
+
+    Returns:
+        (updated README content, True if a "Week N" row was found)
+    """
+    pattern = rf'^(\|\s*Week {week}\s*\|)[^|\n]*\|[^|\n]*\|'
+    completion = date if status == "Completed" else ""
+    replacement = lambda m: f"{m.group(1)} {status} | {completion} |"
+    readme_content, count = re.subn(pattern, replacement, readme_content, count=1, flags=re.MULTILINE)
+    return readme_content, bool(count)
+
+
+def count_weeks(readme_content):
+    """Return (completed weeks, total weeks) of the Progress Tracker table."""
+    rows = re.findall(r'^\|\s*Week \d+\s*\|\s*([^|\n]*?)\s*\|', readme_content, re.MULTILINE)
+    return sum(1 for status in rows if status == "Completed"), len(rows)
+
+
+def compact(course_dir):
+    """
+    Fold a course journal into status.json and the course README, then truncate it.
+
+    Args:
+        course_dir: Path to the course directory
+
+    Returns:
+        The number of events compacted.
+    """
+    events = read_events(course_dir)
+    if not events:
+        print(f"No journal events to compact for {course_dir}")
+        return 0
+
+    try:
+        record = load_course_status(course_dir)
+    except StatusError as e:
+        print(f"ERROR: {e}; keeping the journal for {course_dir}")
+        return 0
+    readme_path = os.path.join(course_dir, "README.md")
+    readme_content = None
+    if os.path.exists(readme_path):
+        with open(readme_path, "r", encoding="utf-8") as f:
+            readme_content = f.read()
+    original_readme = readme_content
+
+    weeks_changed = False
+    for event in events:
+        date = event.get("date", "")
+
+        # Any recorded activity means the course has started
+        if record.status == "Not Started":
+            record.status = "In Progress"
+        if not record.start_date:
+            record.start_date = date
+
+        if "week" in event and readme_content is not None:
+            try:
+                # Hand-written events may omit week_status; `log --week` without --done means In Progress
+                week_status = normalize_status(event.get("week_status") or "In Progress")
+            except StatusError as e:
+                print(f"WARNING: Ignoring week event in {course_dir}: {e}")
+            else:
+                readme_content, matched = update_week_row(readme_content, event["week"], week_status, date)
+                if matched:
+                    weeks_changed = True
+                else:
+                    print(f"WARNING: No 'Week {event['week']}' row in {readme_path}; week event not applied")
+        if "progress" in event:
+            try:
+                record.progress_percentage = normalize_percentage(event["progress"])
+                weeks_changed = False
+            except StatusError as e:
+                print(f"WARNING: Ignoring progress event in {course_dir}: {e}")
+        if "status" in event:
+            try:
+                record.status = normalize_status(event["status"])
+            except StatusError as e:
+                print(f"WARNING: Ignoring status event in {course_dir}: {e}")
+        if "note" in event:
+            record.notes = event["note"]
+        record.last_updated = date
+
+    # Derive progress from the tracker unless a later event set it explicitly
+    if weeks_changed:
+        completed, total = count_weeks(readme_content)
+        if total:
+            record.progress_percentage = round(100 * completed / total)
+            if completed == total:
+                record.status = "Completed"
+
+    if record.status == "Completed" and not record.completion_date:
+        record.completion_date = record.last_updated
+
+    status_path = os.path.join(course_dir, "status.json")
+    save_status(record, status_path)
+
+    if readme_content is not None and readme_content != original_readme:
+        with open(readme_path, "w", encoding="utf-8") as f:
+            f.write(readme_content)
+
+    # Truncate only after the snapshot has been written
+    open(os.path.join(course_dir, JOURNAL_NAME), "w").close()
+    print(f"Compacted {len(events)} events into {status_path}")
+    return len(events)
+
+
+def percentage(value):
+    """argparse type for --progress: an integer from 0 to 100."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid percentage: {value!r}") from None
+    if not 0 <= number <= 100:
+        raise argparse.ArgumentTypeError(f"percentage must be between 0 and 100, got {number}")
+    return number
+
+
+def build_event(args):
+    """Build a journal event from the `log` command line arguments."""
+    event = {"date": datetime.now().strftime("%Y-%m-%d")}
+    if args.week is not None:
+        event["week"] = args.week
+        event["week_status"] = "Completed" if args.done else "In Progress"
+    if args.progress is not None:
+        event["progress"] = args.progress
+    if args.status:
+        event["status"] = args.status
+    if args.note:
+        event["note"] = args.note
+    return event
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record OSSU progress in an append-only journal.")
+    parser.add_argument("--root", default=".", help="Tracker repository root (default: .)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    log_parser = subparsers.add_parser("log", help="Append a progress event to a course journal")
+    log_parser.add_argument("course", help="Course directory name, e.g. cs50")
+    log_parser.add_argument("--week", type=int, help="Week/Module number in the Progress Tracker")
+    log_parser.add_argument("--done", action="store_true", help="Mark the week as Completed")
+    log_parser.add_argument("--progress", type=percentage, help="Set progress_percentage (0-100)")
+    log_parser.add_argument("--status", choices=STATUSES,
+                            help="Set the course status")
+    log_parser.add_argument("--note", help="Set the course notes")
+    log_parser.add_argument("--threshold", type=int, default=DEFAULT_THRESHOLD,
+                            help=f"Compact once the journal has this many events (default: {DEFAULT_THRESHOLD})")
+
+    compact_parser = subparsers.add_parser("compact", help="Fold journals into status.json and README.md")
+    compact_parser.add_argument("courses", nargs="*",
+                                help="Course directory names (default: every course with a journal)")
+
+    args = parser.parse_args()
+
+    if args.command == "log":
+        course_dir = os.path.join(args.root, args.course)
+        if not os.path.isdir(course_dir):
+            parser.error(f"course directory not found: {course_dir}")
+        event = build_event(args)
+        if len(event) == 1:
+            parser.error("nothing to log; pass --week, --progress, --status or --note")
+
+        pending = append_event(course_dir, event)
+        print(f"Logged event for {args.course} ({pending} pending)")
+        if pending >= args.threshold:
+            compact(course_dir)
+
+    elif args.command == "compact":
+        courses = args.courses or sorted(
+            d for d in os.listdir(args.root)
+            if os.path.exists(os.path.join(args.root, d, JOURNAL_NAME))
+        )
+        for course in courses:
+            compact(os.path.join(args.root, course))
+
+
+if __name__ == "__main__":
+    with profile_from_argv("progress_journal"):
+        main()
@@ -0,0 +1,381 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped README.md table updates with a persisted row offset index.
+
+For very large dashboards, reading and rewriting the whole README to change a few
+cells costs the size of the file. This module instead:
+1. Keeps an index of the byte offset of every table row, keyed by the course name in
+   the row's first cell, in a sidecar file (.README.md.index) of fixed-size records
+   sorted by key hash, so a lookup is a binary search over the mapped index
+2. Memory-maps README.md and overwrites a cell in place when the new text fits the
+   cell's current (padded) width
+3. Falls back to a streaming rewrite, and rebuilds the index, only when a row changes
+   length
+
+A small stamp file (.README.md.index.stamp) records the README's size, mtime and git
+blob hash. The size and mtime are the fast check; when only the mtime differs, as after
+a fresh checkout, the blob hash decides, so an index restored from a CI cache (see the
+update workflows) stays valid. The index is rebuilt whenever the README's content
+changed, so edits made by other tools are picked up safely.
+
+update_rows() patches any number of rows of one file with a single mapping, index check
+and stamp update. An in-place batch costs the changed rows plus one SHA-1 pass over the
+file for the stamp; only a row that changes length costs a rewrite and an index rebuild.
+
+With compact=True, as the updaters' --mmap mode uses it, every cell up to the last
+updated one is written as "| text |", exactly the bytes the regex updaters write. Cells
+are then patched in place only when the new text has the same length as the old, e.g.
+"Not Started" -> "In Progress", and the row is rewritten otherwise.
+
+    python .github/scripts/readme_mmap.py README.md --course CS50 --set 1="Completed"
+"""
+
+import os
+import re
+import json
+import mmap
+import struct
+import hashlib
+import argparse
+from contextlib import contextmanager
+
+from catalog import normalize_key, resolve_course
+from profiling import profile_from_argv
+
+# Bytes copied per write during a fallback rewrite
+COPY_CHUNK = 1 << 20
+
+# One index record: 64-bit hash of the row key, byte offset of the row
+RECORD = struct.Struct(">QQ")
+
+
+def index_paths_for(readme_path):
+    """Return the sidecar (index, stamp) paths of a README."""
+    directory, name = os.path.split(os.path.abspath(readme_path))
+    base = os.path.join(directory, f".{name}.index")
+    return base, base + ".stamp"
+
+
+def row_key(first_cell):
+    """Return the index key of a row from its first cell, e.g. "[CS50](url)" -> "cs50"."""
+    text = first_cell.strip()
+    link = re.match(r'\[([^\]]*)\]', text)
+    if link:
+        text = link.group(1)
+    return normalize_key(text)
+
+
+def key_hash(key):
+    """Return the 64-bit hash a row key is stored under in the index."""
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def iter_rows(mm):
+    """Yield (row key, offset of the leading "|") for every addressable table row."""
+    for match in re.finditer(rb'^\|([^|\n]*)\|', mm, re.MULTILINE):
+        first_cell = match.group(1).decode("utf-8", "replace").strip()
+        # Header and separator rows are not addressable
+        if first_cell == "Course" or set(first_cell) <= set("-: "):
+            continue
+        key = row_key(first_cell)
+        if key:
+            yield key, match.start()
+
+
+def blob_hash(mm):
+    """Return the git blob hash of a mapped file, which does not change on checkout."""
+    digest = hashlib.sha1(b"blob %d\0" % len(mm))
+    digest.update(mm)
+    return digest.hexdigest()
+
+
+def save_stamp(readme_path, mm):
+    """Record the README size, mtime and blob hash the index is valid for."""
+    stat = os.stat(readme_path)
+    stamp_path = index_paths_for(readme_path)[1]
+    with open(stamp_path, "w", encoding="utf-8") as f:
+        json.dump({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "blob": blob_hash(mm)}, f)
+
+
+def build_index(readme_path, mm):
+    """
+    Scan a mapped README once and persist its row index.
+
+    The index is a file of fixed-size (key hash, row offset) records sorted by hash, so a
+    lookup is a binary search over the mapped index rather than a load of the whole table.
+    """
+    seen = set()
+    records = []
+    for key, offset in iter_rows(mm):
+        # The first row with a given key wins, as in the regex updaters
+        if key not in seen:
+            seen.add(key)
+            records.append((key_hash(key), offset))
+    records.sort()
+
+    index_path = index_paths_for(readme_path)[0]
+    tmp_path = index_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(b"".join(RECORD.pack(*record) for record in records))
+    os.replace(tmp_path, index_path)
+    save_stamp(readme_path, mm)
+
+
+def index_is_current(readme_path, mm):
+    """Return True if the persisted index matches the README's current content."""
+    stat = os.stat(readme_path)
+    index_path, stamp_path = index_paths_for(readme_path)
+    try:
+        with open(stamp_path, "r", encoding="utf-8") as f:
+            stamp = json.load(f)
+        if not os.path.exists(index_path) or stamp["size"] != stat.st_size:
+            return False
+        if stamp["mtime_ns"] == stat.st_mtime_ns:
+            return True
+        # Same size, new mtime: a checkout or a restored cache if the content is unchanged
+        if stamp.get("blob") != blob_hash(mm):
+            return False
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+    save_stamp(readme_path, mm)
+    return True
+
+
+@contextmanager
+def mapped_index(readme_path):
+    """Map the persisted index of a README read-only; yields b"" for an empty index."""
+    with open(index_paths_for(readme_path)[0], "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as index:
+            yield index
+
+
+def lookup(index, mm, key):
+    """Binary search a mapped index for a row key; return the row offset or None."""
+    target = key_hash(key)
+    count = len(index) // RECORD.size
+    lo, hi = 0, count
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if RECORD.unpack_from(index, mid * RECORD.size)[0] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+
+    # Check every record with this hash against the row itself
+    while lo < count:
+        record_hash, offset = RECORD.unpack_from(index, lo * RECORD.size)
+        if record_hash != target:
+            break
+        cell_end = mm.find(b"|", offset + 1)
+        if cell_end != -1 and row_key(mm[offset + 1:cell_end].decode("utf-8", "replace")) == key:
+            return offset
+        lo += 1
+    return None
+
+
+def find_row(index, mm, course_name):
+    """Return the offset of a course row: exact match, catalog alias, then substring."""
+    key = normalize_key(course_name)
+    if not key:
+        return None
+    offset = lookup(index, mm, key)
+    if offset is not None:
+        return offset
+
+    course = resolve_course(course_name)
+    if course:
+        offset = lookup(index, mm, normalize_key(course["full_name"]))
+        if offset is not None:
+            return offset
+
+    # Partial names need a scan, which costs as much as rebuilding the index
+    for row_name, offset in iter_rows(mm):
+        if key in row_name:
+            return offset
+    return None
+
+
+def row_pipes(mm, row_start):
+    """Return the offsets of every "|" in the row starting at row_start."""
+    row_end = mm.find(b"\n", row_start)
+    if row_end == -1:
+        row_end = len(mm)
+    line = mm[row_start:row_end]
+    return [row_start + i for i, byte in enumerate(line) if byte == 0x7C]
+
+
+def format_cell(text, width=0):
+    """Return a cell's bytes: the text with one space each side, padded to width."""
+    cell = f" {text} ".encode("utf-8")
+    return cell.ljust(width, b" ")
+
+
+def new_row(mm, pipes, cells, pad):
+    """Return the bytes of a row with the given cells replaced."""
+    parts = []
+    for column in range(len(pipes) - 1):
+        if column in cells:
+            parts.append(format_cell(cells[column], pad))
+        else:
+            parts.append(mm[pipes[column] + 1:pipes[column + 1]])
+    return b"|" + b"|".join(parts) + b"|"
+
+
+def rewrite_rows(readme_path, mm, rows, pad):
+    """
+    Stream the mapped README into a new file with rows replaced.
+
+    Args:
+        rows: {row offset: (pipe offsets, cells)}
+
+    Returns:
+        The path of the new file.
+    """
+    tmp_path = readme_path + ".tmp"
+    view = memoryview(mm)
+    try:
+        with open(tmp_path, "wb") as out:
+            position = 0
+            for row_start in sorted(rows):
+                pipes, cells = rows[row_start]
+                for start in range(position, row_start, COPY_CHUNK):
+                    out.write(view[start:min(start + COPY_CHUNK, row_start)])
+                out.write(new_row(mm, pipes, cells, pad))
+                position = pipes[-1] + 1
+            for start in range(position, len(mm), COPY_CHUNK):
+                out.write(view[start:min(start + COPY_CHUNK, len(mm))])
+    finally:
+        view.release()
+    return tmp_path
+
+
+def update_rows(readme_path, updates, pad=0, compact=False):
+    """
+    Update cells of several course rows of one file, in place when possible.
+
+    The file is mapped, its index checked and its stamp written once for the whole
+    batch; if any row changes length, all rows are written in a single streaming rewrite.
+
+    Args:
+        readme_path: Path to the README.md
+        updates: {course name: {column index: new text}}, column 0 being the Course column
+        pad: Minimum cell width used when rows have to be rewritten, leaving room
+             for later in-place updates
+        compact: Write every cell up to the last updated one as "| text |", as the
+                 regex updaters do, instead of keeping the cells' padding; pad is ignored
+
+    Returns:
+        {course name: "in-place", "rewrite", "unchanged" or None if the row was not found}
+    """
+    results = dict.fromkeys(updates)
+    tmp_path = None
+    with open(readme_path, "r+b") as f:
+        with mmap.mmap(f.fileno(), 0) as mm:
+            if not index_is_current(readme_path, mm):
+                build_index(readme_path, mm)
+
+            # Courses that resolve to the same row share it; later cells win
+            rows = {}
+            courses_of_row = {}
+            with mapped_index(readme_path) as index:
+                for course_name, cells in updates.items():
+                    row_start = find_row(index, mm, course_name)
+                    if row_start is None:
+                        print(f"WARNING: Could not find course '{course_name}' in {readme_path}")
+                        continue
+                    pipes = row_pipes(mm, row_start)
+                    if any(column >= len(pipes) - 1 for column in cells):
+                        print(f"WARNING: Row for '{course_name}' has only {len(pipes) - 1} columns")
+                        continue
+                    rows.setdefault(row_start, (pipes, {}))[1].update(cells)
+                    courses_of_row.setdefault(row_start, []).append(course_name)
+
+            if compact:
+                pad = 0
+                # Cells before the last updated one are rewritten with their text stripped
+                for pipes, cells in rows.values():
+                    for column in range(max(cells, default=-1) + 1):
+                        if column not in cells:
+                            text = mm[pipes[column] + 1:pipes[column + 1]].decode("utf-8").strip()
+                            cells[column] = text
+
+            patches = {}
+            for row_start, (pipes, cells) in rows.items():
+                for column, text in cells.items():
+                    start, end = pipes[column] + 1, pipes[column + 1]
+                    cell = format_cell(text, 0 if compact else end - start)
+                    if len(cell) != end - start:
+                        # The row changes length, so every later offset moves
+                        tmp_path = rewrite_rows(readme_path, mm, rows, pad)
+                        break
+                    if mm[start:end] != cell:
+                        patches.setdefault(row_start, []).append((start, end, cell))
+                if tmp_path:
+                    break
+            else:
+                for row_patches in patches.values():
+                    for start, end, cell in row_patches:
+                        mm[start:end] = cell
+                if patches:
+                    mm.flush()
+                    # Offsets are unchanged by an in-place patch; only the stamp needs refreshing
+                    save_stamp(readme_path, mm)
+
+    if tmp_path:
+        os.replace(tmp_path, readme_path)
+        with open(readme_path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                build_index(readme_path, mm)
+
+    for row_start, course_names in courses_of_row.items():
+        result = "rewrite" if tmp_path else "in-place" if row_start in patches else "unchanged"
+        for course_name in course_names:
+            results[course_name] = result
+    return results
+
+
+def update_row(readme_path, course_name, cells, pad=0, compact=False):
+    """
+    Update cells of one course row, in place when possible.
+
+    Args:
+        readme_path: Path to the README.md
+        course_name: Course to update, matched against the row's first cell
+        cells: {column index: new text}, column 0 being the Course column
+        pad: Minimum cell width used when the row has to be rewritten
+        compact: Write the cells as the regex updaters do (see update_rows)
+
+    Returns:
+        "in-place", "rewrite", "unchanged" or None if the course was not found.
+    """
+    return update_rows(readme_path, {course_name: cells}, pad, compact)[course_name]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Patch README.md table cells in place.")
+    parser.add_argument("readme", help="Path to the README.md")
+    parser.add_argument("--course", required=True, help="Course whose row to update")
+    parser.add_argument("--set", dest="cells", action="append", default=[], metavar="COLUMN=TEXT",
+                        help="Set a cell, e.g. 1=Completed (column 0 is the Course column)")
+    parser.add_argument("--pad", type=int, default=0,
+                        help="Minimum cell width when a row has to be rewritten")
+    args = parser.parse_args()
+
+    cells = {}
+    for assignment in args.cells:
+        column, _, text = assignment.partition("=")
+        if not column.isdigit():
+            parser.error(f"invalid --set value: {assignment}")
+        cells[int(column)] = text
+
+    result = update_row(args.readme, args.course, cells, args.pad)
+    if result:
+        print(f"{args.course}: {result}")
+
+
+if __name__ == "__main__":
+    with profile_from_argv("readme_mmap"):
+        main()
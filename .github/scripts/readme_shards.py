@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+Optional sharded layout of the README.md progress tables.
+
+With the full catalog and cohort rows, a single README.md holding every course table is
+read and written on every update and renders slowly. In the sharded layout each catalog
+category's table lives in its own generated file under progress/, and README.md only
+keeps a small index with per-category status counts between
+<!-- shards:start --> and <!-- shards:end --> markers.
+
+progress/index.json lists the shards and their counts; the layout is active whenever it
+exists. The updaters call target_for() to route a course to its shard, write only that
+file, and then refresh_index() to recount the shards they touched, so an update costs the
+size of one category rather than the whole curriculum.
+
+    python .github/scripts/readme_shards.py split    # move the tables into progress/
+    python .github/scripts/readme_shards.py index    # recount every shard
+    python .github/scripts/readme_shards.py join     # move the tables back into README.md
+    python .github/scripts/readme_shards.py files    # list the files the updaters may write
+
+The workflows commit the output of "files" with git_commit_files.py, so shard rows and
+index counts are always committed together, and shards removed by "join" are deleted.
+"""
+
+import os
+import re
+import json
+import argparse
+
+from catalog import load_curriculum, resolve_course
+from course_status import STATUSES
+from readme_mmap import index_paths_for, row_key
+from profiling import profile_from_argv
+
+# Directory of the shard files, relative to the README
+SHARD_DIR = "progress"
+MANIFEST = "index.json"
+
+SECTION_START = "<!-- shards:start -->"
+SECTION_END = "<!-- shards:end -->"
+
+HEADER = "| Course | Status | Repo Link | Progress | Notes | Completion Date |"
+SEPARATOR = "|--------|--------|-----------|-------|-----------------|-|"
+
+
+def shard_file_name(category):
+    """Return the shard file name of a category, e.g. "Core Math" -> "core-math.md"."""
+    return re.sub(r'[^a-z0-9]+', '-', category.lower()).strip("-") + ".md"
+
+
+def manifest_path_for(readme_path):
+    """Return the path of the shard manifest that belongs to a README."""
+    return os.path.join(os.path.dirname(readme_path), SHARD_DIR, MANIFEST)
+
+
+def load_manifest(readme_path):
+    """Return the shard manifest of a README, or None if the README is not sharded."""
+    try:
+        with open(manifest_path_for(readme_path), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_manifest(readme_path, manifest):
+    """Atomically write the shard manifest of a README."""
+    manifest_path = manifest_path_for(readme_path)
+    tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_path, manifest_path)
+
+
+def target_for(readme_path, course_name):
+    """
+    Return the file holding a course's row.
+
+    Returns:
+        The course's shard if the README is sharded and the course is in the catalog,
+        otherwise readme_path itself.
+    """
+    manifest = load_manifest(readme_path)
+    if manifest is None:
+        return readme_path
+    course = resolve_course(course_name)
+    if course is None:
+        return readme_path
+    for shard in manifest["shards"]:
+        if shard["category"] == course["category"]:
+            return os.path.join(os.path.dirname(readme_path), SHARD_DIR, shard["file"])
+    return readme_path
+
+
+def tracker_files(readme_path):
+    """
+    Return the paths the updaters may write: README.md and the shard directory.
+
+    The directory is listed even when the README is not sharded, so that committing
+    it with git_commit_files.py also deletes the shards removed by join().
+    """
+    return [readme_path, os.path.join(os.path.dirname(readme_path), SHARD_DIR)]
+
+
+def is_row(line):
+    """Return True for a table row that is neither a header nor a separator."""
+    if not line.startswith("|"):
+        return False
+    first_cell = line.strip()[1:].split("|")[0].strip()
+    return first_cell != "Course" and not set(first_cell) <= set("-: ")
+
+
+def count_statuses(shard_path):
+    """Count the rows of a shard by their Status cell."""
+    counts = dict.fromkeys(STATUSES, 0)
+    with open(shard_path, "r", encoding="utf-8") as f:
+        for line in f:
+            if is_row(line):
+                cells = line.strip()[1:-1].split("|")
+                status = cells[1].strip() if len(cells) > 1 else ""
+                counts[status if status in counts else "Not Started"] += 1
+    return counts
+
+
+def format_index(manifest):
+    """Render the README index of the shards."""
+    lines = [SECTION_START, "| Category | " + " | ".join(STATUSES) + " | Total |",
+             "|----------|" + "|".join("-" * (len(status) + 2) for status in STATUSES) + "|-------|"]
+    totals = dict.fromkeys(STATUSES, 0)
+    for shard in manifest["shards"]:
+        counts = shard["counts"]
+        for status in STATUSES:
+            totals[status] += counts.get(status, 0)
+        lines.append(f"| [{shard['category']}]({SHARD_DIR}/{shard['file']}) | "
+                     + " | ".join(str(counts.get(status, 0)) for status in STATUSES)
+                     + f" | {sum(counts.values())} |")
+    lines.append("| **Total** | " + " | ".join(str(totals[status]) for status in STATUSES)
+                 + f" | {sum(totals.values())} |")
+    lines.append(SECTION_END)
+    return "\n".join(lines)
+
+
+def write_index(readme_path, manifest):
+    """Replace the index section of the README, inserting it after "## My Progress" if missing."""
+    with open(readme_path, "r", encoding="utf-8") as f:
+        readme_content = f.read()
+
+    section = format_index(manifest)
+    pattern = re.escape(SECTION_START) + r'.*?' + re.escape(SECTION_END)
+    if re.search(pattern, readme_content, re.DOTALL):
+        new_content = re.sub(pattern, lambda m: section, readme_content, flags=re.DOTALL)
+    elif "\n## My Progress\n" in readme_content:
+        new_content = readme_content.replace("\n## My Progress\n", f"\n## My Progress\n\n{section}\n", 1)
+    else:
+        new_content = readme_content.rstrip("\n") + f"\n\n{section}\n"
+
+    if new_content != readme_content:
+        with open(readme_path, "w", encoding="utf-8") as f:
+            f.write(new_content)
+
+
+def refresh_index(readme_path, shard_paths):
+    """
+    Recount the given shards and rewrite the README index.
+
+    Args:
+        readme_path: Path to the README.md
+        shard_paths: Shard files that were changed; other shards keep their recorded counts
+    """
+    manifest = load_manifest(readme_path)
+    if manifest is None:
+        return
+    changed = {os.path.basename(path) for path in shard_paths}
+    for shard in manifest["shards"]:
+        if shard["file"] in changed:
+            shard["counts"] = count_statuses(os.path.join(os.path.dirname(readme_path), SHARD_DIR, shard["file"]))
+    save_manifest(readme_path, manifest)
+    write_index(readme_path, manifest)
+
+
+def drop_empty_headings(lines):
+    """Remove "###" and deeper headings with no content before the next heading of their level."""
+    changed = True
+    while changed:
+        changed = False
+        for i, line in enumerate(lines):
+            if not line.startswith("###"):
+                continue
+            level = len(line) - len(line.lstrip("#"))
+            following = next((other for other in lines[i + 1:] if other.strip()), None)
+            if following is None or (following.startswith("#")
+                                     and len(following) - len(following.lstrip("#")) <= level):
+                del lines[i]
+                changed = True
+                break
+    return lines
+
+
+def split(readme_path):
+    """
+    Move every catalog course row of README.md into its category's shard.
+
+    Rows of courses that are not in the catalog stay in README.md. Tables left without
+    rows are removed together with their heading, and catalog courses missing from the
+    README get a "Not Started" row in their shard. The manifest records the level of
+    each category's heading and the heading it was nested under, e.g. "#### Core Math"
+    under "### Core Computer Science", so that join() can restore the layout.
+    """
+    if load_manifest(readme_path) is not None:
+        print(f"{readme_path} is already sharded")
+        return
+
+    with open(readme_path, "r", encoding="utf-8") as f:
+        lines = f.read().split("\n")
+
+    curriculum = load_curriculum()
+    shard_rows = {category: [] for category in curriculum}
+    layout = {}
+    headings = []
+    seen = set()
+    kept = []
+    i = 0
+    while i < len(lines):
+        if not lines[i].startswith("| Course |"):
+            if lines[i].startswith("#"):
+                level = len(lines[i]) - len(lines[i].lstrip("#"))
+                while headings and headings[-1][0] >= level:
+                    headings.pop()
+                headings.append((level, lines[i]))
+            kept.append(lines[i])
+            i += 1
+            continue
+
+        end = i + 1
+        while end < len(lines) and lines[end].startswith("|"):
+            end += 1
+        table_rows = []
+        for row in lines[i:end]:
+            if not is_row(row):
+                continue
+            course = resolve_course(row_key(row.strip()[1:].split("|")[0]))
+            if course is None:
+                table_rows.append(row)
+            else:
+                shard_rows[course["category"]].append(row)
+                seen.add(course["name"])
+                if course["category"] not in layout and headings and headings[-1][0] > 2:
+                    parents = [line for level, line in headings[:-1] if level > 2]
+                    layout[course["category"]] = {"level": headings[-1][0],
+                                                  "parent": parents[-1] if parents else None}
+
+        if table_rows:
+            kept.extend(lines[i:i + 2] + table_rows)
+        else:
+            while kept and not kept[-1].strip():
+                kept.pop()
+            if kept and kept[-1].startswith("#") and not kept[-1].startswith("## "):
+                kept.pop()
+            kept.append("")
+        i = end
+
+    os.makedirs(os.path.join(os.path.dirname(readme_path), SHARD_DIR), exist_ok=True)
+    manifest = {"shards": []}
+    for category, courses in curriculum.items():
+        rows = shard_rows[category]
+        rows.extend(f"| [{course['full_name']}]({course['url']}) | Not Started | | | | |"
+                    for course in courses if course["name"] not in seen)
+        file_name = shard_file_name(category)
+        shard_path = os.path.join(os.path.dirname(readme_path), SHARD_DIR, file_name)
+        with open(shard_path, "w", encoding="utf-8") as f:
+            f.write(f"# {category}\n\n[Back to README](../README.md)\n\n")
+            f.write("\n".join([HEADER, SEPARATOR, *rows]) + "\n")
+        manifest["shards"].append({"category": category, "file": file_name,
+                                   **layout.get(category, {"level": 3, "parent": None}),
+                                   "counts": count_statuses(shard_path)})
+
+    content = "\n".join(drop_empty_headings(kept))
+    content = re.sub(r'\n{3,}', "\n\n", content)
+    with open(readme_path, "w", encoding="utf-8") as f:
+        f.write(content)
+    save_manifest(readme_path, manifest)
+    write_index(readme_path, manifest)
+    print(f"Split {readme_path} into {len(manifest['shards'])} shards in {SHARD_DIR}/")
+
+
+def join(readme_path):
+    """
+    Move the shard tables back into README.md in place of the index and remove the shards.
+
+    Each table gets its heading back at the level recorded by split(), preceded by its
+    parent heading where that changes from the previous table. Manifests written before
+    the layout was recorded join every table under a "###" heading.
+    """
+    manifest = load_manifest(readme_path)
+    if manifest is None:
+        print(f"{readme_path} is not sharded")
+        return
+
+    shard_dir = os.path.join(os.path.dirname(readme_path), SHARD_DIR)
+    tables = []
+    parent = None
+    for shard in manifest["shards"]:
+        with open(os.path.join(shard_dir, shard["file"]), "r", encoding="utf-8") as f:
+            table = [line for line in f.read().split("\n") if line.startswith("|")]
+        if shard.get("parent") and shard["parent"] != parent:
+            tables.append(shard["parent"])
+        parent = shard.get("parent")
+        tables.append("#" * shard.get("level", 3) + f" {shard['category']}\n" + "\n".join(table))
+
+    with open(readme_path, "r", encoding="utf-8") as f:
+        readme_content = f.read()
+    pattern = re.escape(SECTION_START) + r'.*?' + re.escape(SECTION_END)
+    new_content = re.sub(pattern, lambda m: "\n\n".join(tables), readme_content, flags=re.DOTALL)
+    with open(readme_path, "w", encoding="utf-8") as f:
+        f.write(new_content)
+
+    for shard in manifest["shards"]:
+        shard_path = os.path.join(shard_dir, shard["file"])
+        for path in (shard_path, *index_paths_for(shard_path)):
+            if os.path.exists(path):
+                os.remove(path)
+    os.remove(manifest_path_for(readme_path))
+    if not os.listdir(shard_dir):
+        os.rmdir(shard_dir)
+    print(f"Joined {len(manifest['shards'])} shards back into {readme_path}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Split the README.md progress tables into per-category files.")
+    parser.add_argument("command", choices=["split", "index", "join", "files"],
+                        help="split the README, recount every shard, join the shards back, "
+                             "or list the files the updaters may write")
+    parser.add_argument("--readme", default="README.md", help="Path to the README.md (default: README.md)")
+    args = parser.parse_args()
+
+    if args.command == "split":
+        split(args.readme)
+    elif args.command == "join":
+        join(args.readme)
+    elif args.command == "files":
+        print("\n".join(tracker_files(args.readme)))
+    else:
+        manifest = load_manifest(args.readme)
+        if manifest is None:
+            parser.error(f"{args.readme} is not sharded")
+        refresh_index(args.readme, [shard["file"] for shard in manifest["shards"]])
+
+
+if __name__ == "__main__":
+    with profile_from_argv("readme_shards"):
+        main()
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Shadow mode: compare the legacy README updaters against the readme_mmap engine.
+
+Each updater (update_progress.py, cs50_update_progress.py, cs50w_update_progress.py)
+is checked in two pairings, so a loader change and an engine change are told apart:
+- legacy/regex: the script as of a git revision, by default the repository's root
+  commit, loaded straight from git, against the current script's default regex path
+- regex/mmap: the current regex path against the current --mmap mode
+Both sides run on identical copies of the same README.md and status.json files inside
+throwaway directories, so nothing in the real repository is written.
+
+The bar is byte-identical output. Results are reported per pairing as identical,
+whitespace-only differences or divergent; anything but identical fails the check, and
+the script exits with status 1. The time and peak memory (tracemalloc) of both sides are
+reported as well. Every case starts from a fresh directory, so the mmap side always
+pays for building its row index.
+
+Cases come from a seeded generator of randomized READMEs and status files, including
+legacy tables without a Progress column and non-canonical status spellings, or from a
+real tracker repository with --repo:
+
+    python .github/scripts/shadow_compare.py --cases 2000 --seed 7
+    python .github/scripts/shadow_compare.py --repo . --report-dir shadow-report
+    python .github/scripts/shadow_compare.py --legacy-ref HEAD~5
+"""
+
+import io
+import os
+import sys
+import json
+import time
+import random
+import difflib
+import argparse
+import tempfile
+import subprocess
+import tracemalloc
+import importlib.util
+from contextlib import redirect_stdout
+
+import update_progress
+import cs50_update_progress
+import cs50w_update_progress
+from catalog import course_dir_name, load_curriculum, resolve_course
+from course_status import STATUSES, find_status_files
+
+HEADER = "| Course | Status | Repo Link | Progress | Notes | Completion Date |"
+SEPARATOR = "|--------|--------|-----------|-------|-----------------|-|"
+
+# Tables written before the Progress column existed, which the CS50 updaters migrate
+LEGACY_HEADER = "| Course | Status | Repo Link | Notes | Completion Date |"
+LEGACY_SEPARATOR = "|--------|--------|-----------|-----------------|-|"
+
+# Status spellings found in hand-edited status.json files and README cells
+STATUS_SPELLINGS = [*STATUSES, "completed", "in progress", " Not started ", "IN PROGRESS"]
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+UPDATERS = ("update_progress", "cs50_update_progress", "cs50w_update_progress")
+
+
+def root_commit():
+    """Return the first commit of the repository holding the scripts."""
+    result = subprocess.run(["git", "rev-list", "--max-parents=0", "HEAD"], cwd=SCRIPT_DIR,
+                            check=True, capture_output=True, text=True)
+    return result.stdout.split()[-1]
+
+
+def load_legacy_updaters(revision, module_dir):
+    """
+    Import the updater scripts as of a git revision.
+
+    Args:
+        revision: Git revision to read the scripts from
+        module_dir: Directory to write the scripts to before importing them
+
+    Returns:
+        {script name: module}
+    """
+    modules = {}
+    for name in UPDATERS:
+        source = subprocess.run(["git", "show", f"{revision}:./{name}.py"], cwd=SCRIPT_DIR,
+                                check=True, capture_output=True, text=True).stdout
+        path = os.path.join(module_dir, f"legacy_{name}.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(source)
+        spec = importlib.util.spec_from_file_location(f"legacy_{name}", path)
+        modules[name] = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modules[name])
+    return modules
+
+
+def course_updater(module, function, status_dir, use_mmap=None):
+    """Return an engine running a CS50-style updater, which addresses ../../README.md."""
+    def run(root):
+        os.chdir(os.path.join(root, ".github", "scripts"))
+        status_file = os.path.join(root, status_dir, "status.json")
+        with redirect_stdout(io.StringIO()):
+            if use_mmap is None:
+                getattr(module, function)(status_file)
+            else:
+                getattr(module, function)(status_file, use_mmap=use_mmap)
+    return run
+
+
+def readme_updater(module, use_mmap=None):
+    """Return an engine running update_progress.update_readme in the tracker root."""
+    def run(root):
+        with redirect_stdout(io.StringIO()):
+            if use_mmap is None:
+                module.update_readme()
+            else:
+                module.update_readme(use_mmap=use_mmap)
+    return run
+
+
+def build_engines(legacy):
+    """
+    Pair each legacy updater with the current regex path, and that with the --mmap mode.
+
+    Returns:
+        {pairing name: (baseline engine, candidate engine)}
+    """
+    engines = {}
+    for name, module, function, status_dir in (
+            ("update_progress", update_progress, None, None),
+            ("cs50", cs50_update_progress, "update_cs50_in_readme", "cs50"),
+            ("cs50w", cs50w_update_progress, "update_cs50w_in_readme", "cs50w")):
+        if function is None:
+            legacy_engine = readme_updater(legacy[module.__name__])
+            regex_engine = readme_updater(module, use_mmap=False)
+            mmap_engine = readme_updater(module, use_mmap=True)
+        else:
+            legacy_engine = course_updater(legacy[module.__name__], function, status_dir)
+            regex_engine = course_updater(module, function, status_dir, use_mmap=False)
+            mmap_engine = course_updater(module, function, status_dir, use_mmap=True)
+        engines[f"{name} legacy/regex"] = (legacy_engine, regex_engine)
+        engines[f"{name} regex/mmap"] = (regex_engine, mmap_engine)
+    return engines
+
+
+def random_cell(rng, choices):
+    """Return a random cell value with random padding."""
+    return " " * rng.randint(0, 2) + rng.choice(choices) + " " * rng.randint(0, 2)
+
+
+def generate_case(rng, filler_rows=50):
+    """
+    Generate a randomized README and status files.
+
+    Returns:
+        (README text, {course directory: status.json dict})
+    """
+    curriculum = load_curriculum()
+    # A quarter of the cases use tables from before the Progress column existed
+    legacy_layout = rng.random() < 0.25
+    header, separator = (LEGACY_HEADER, LEGACY_SEPARATOR) if legacy_layout else (HEADER, SEPARATOR)
+
+    lines = ["# My OSSU Computer Science Journey", "", "## My Progress", ""]
+    for category, courses in curriculum.items():
+        lines.extend([f"### {category}", header, separator])
+        for course in courses:
+            cells = [
+                f"[{course['full_name']}]({course['url']})",
+                random_cell(rng, STATUS_SPELLINGS),
+                random_cell(rng, ["", "[Repo](https://github.com/example/repo)"]),
+                random_cell(rng, ["", "10%", "55%"]),
+                random_cell(rng, ["", "Some notes", "Week 2 done"]),
+                random_cell(rng, ["", "2025-04-08"]),
+            ]
+            if legacy_layout:
+                del cells[3]
+            lines.append("| " + " | ".join(cells) + " |")
+        lines.append("")
+
+    lines.extend(["### Cohort", header, separator])
+    for i in range(rng.randint(0, filler_rows)):
+        lines.append(f"| Learner {i} | {rng.choice(STATUSES)} |" + " |" * (header.count("|") - 3))
+    lines.extend(["", "## Log", "(Weekly logs)", ""])
+
+    statuses = {}
+    all_courses = [course for courses in curriculum.values() for course in courses]
+    chosen = rng.sample(all_courses, rng.randint(0, 4))
+    for course in [resolve_course("CS50"), resolve_course("CS50W"), *chosen]:
+        status = rng.choice(STATUS_SPELLINGS)
+        statuses[course_dir_name(course)] = {
+            "course_name": course["full_name"],
+            "status": status,
+            "progress_percentage": rng.choice([0, 25, 50, 100]),
+            "start_date": rng.choice(["", "2025-04-08"]),
+            "completion_date": "2025-06-01" if status.strip().lower() == "completed" else "",
+            "repo_link": rng.choice(["", "https://github.com/example/course"]),
+            "notes": rng.choice(["", "Going well", "Stuck on week 3"]),
+            "last_updated": "2025-04-08",
+        }
+    return "\n".join(lines), statuses
+
+
+def load_repo_case(repo_root):
+    """Use a real tracker repository's README.md and status files as a single case."""
+    with open(os.path.join(repo_root, "README.md"), "r", encoding="utf-8") as f:
+        readme = f.read()
+    statuses = {}
+    for status_file in find_status_files(repo_root):
+        with open(status_file, "r", encoding="utf-8") as f:
+            statuses[os.path.basename(os.path.dirname(status_file))] = json.load(f)
+    return readme, statuses
+
+
+def materialize(root, readme, statuses):
+    """Write a case into a throwaway tracker directory."""
+    os.makedirs(os.path.join(root, ".github", "scripts"))
+    with open(os.path.join(root, "README.md"), "w", encoding="utf-8") as f:
+        f.write(readme)
+    for course_dir, status_data in statuses.items():
+        os.makedirs(os.path.join(root, course_dir), exist_ok=True)
+        with open(os.path.join(root, course_dir, "status.json"), "w", encoding="utf-8") as f:
+            json.dump(status_data, f, indent=2)
+
+
+def run_engine(engine, readme, statuses):
+    """
+    Run one engine on a fresh copy of a case.
+
+    Returns:
+        (resulting README text, seconds, peak bytes allocated)
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory(prefix="shadow-") as root:
+        materialize(root, readme, statuses)
+        os.chdir(root)
+        try:
+            tracemalloc.start()
+            start = time.perf_counter()
+            try:
+                engine(root)
+            finally:
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        finally:
+            os.chdir(cwd)
+        with open(os.path.join(root, "README.md"), "r", encoding="utf-8") as f:
+            return f.read(), elapsed, peak
+
+
+def normalize_tables(text):
+    """Collapse the whitespace around table cells, which in-place patching pads."""
+    lines = []
+    for line in text.split("\n"):
+        if line.startswith("|"):
+            line = "| " + " | ".join(cell.strip() for cell in line.strip()[1:-1].split("|")) + " |"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def compare(engines, cases, report_dir=None):
+    """
+    Run every engine pair over every case and collect the results.
+
+    Args:
+        engines: {pairing name: (baseline engine, candidate engine)}
+        cases: Iterable of (case name, README text, statuses)
+        report_dir: Directory to write diffs of every non-identical case to
+
+    Returns:
+        {pairing name: stats dict}
+    """
+    results = {
+        name: {"cases": 0, "identical": 0, "whitespace_only": 0, "divergent": 0, "errors": 0,
+               "baseline_seconds": 0.0, "candidate_seconds": 0.0, "baseline_peak": 0, "candidate_peak": 0}
+        for name in engines
+    }
+    for case_name, readme, statuses in cases:
+        for name, (baseline, candidate) in engines.items():
+            stats = results[name]
+            stats["cases"] += 1
+            try:
+                baseline_out, baseline_time, baseline_peak = run_engine(baseline, readme, statuses)
+                candidate_out, candidate_time, candidate_peak = run_engine(candidate, readme, statuses)
+            except Exception as e:
+                print(f"ERROR: {name} on {case_name}: {e}")
+                stats["errors"] += 1
+                continue
+
+            stats["baseline_seconds"] += baseline_time
+            stats["candidate_seconds"] += candidate_time
+            stats["baseline_peak"] = max(stats["baseline_peak"], baseline_peak)
+            stats["candidate_peak"] = max(stats["candidate_peak"], candidate_peak)
+
+            if baseline_out == candidate_out:
+                stats["identical"] += 1
+                continue
+            if normalize_tables(baseline_out) == normalize_tables(candidate_out):
+                stats["whitespace_only"] += 1
+            else:
+                stats["divergent"] += 1
+            if report_dir:
+                os.makedirs(report_dir, exist_ok=True)
+                baseline_name, candidate_name = name.split(" ")[1].split("/")
+                diff = difflib.unified_diff(baseline_out.splitlines(True), candidate_out.splitlines(True),
+                                            f"{baseline_name}/README.md", f"{candidate_name}/README.md")
+                file_name = f"{case_name}-{name.replace(' ', '-').replace('/', '-')}.diff"
+                with open(os.path.join(report_dir, file_name), "w", encoding="utf-8") as f:
+                    f.writelines(diff)
+    return results
+
+
+def byte_identical(stats):
+    """Return True if every case of an updater produced byte-identical output."""
+    return stats["identical"] == stats["cases"]
+
+
+def print_report(results, legacy_ref):
+    """Print a summary table of the shadow run and whether each pairing is byte-identical."""
+    print(f"legacy: updaters from {legacy_ref}; regex: current scripts; mmap: current scripts with --mmap")
+    print("| Pairing | Cases | Identical | Whitespace-only | Divergent | Errors | Byte-identical "
+          "| Baseline ms | Candidate ms | Speedup | Baseline peak KB | Candidate peak KB |")
+    print("|---------|-------|-----------|-----------------|-----------|--------|----------------"
+          "|-------------|--------------|---------|------------------|-------------------|")
+    for name, s in results.items():
+        speedup = s["baseline_seconds"] / s["candidate_seconds"] if s["candidate_seconds"] else 0
+        print(f"| {name} | {s['cases']} | {s['identical']} | {s['whitespace_only']} | {s['divergent']} "
+              f"| {s['errors']} | {'yes' if byte_identical(s) else 'NO'} "
+              f"| {s['baseline_seconds'] * 1000:.1f} | {s['candidate_seconds'] * 1000:.1f} | {speedup:.2f}x "
+              f"| {s['baseline_peak'] // 1024} | {s['candidate_peak'] // 1024} |")
+
+    failing = [name for name, s in results.items() if not byte_identical(s)]
+    if failing:
+        print(f"FAIL: output is not byte-identical for {', '.join(failing)}")
+    else:
+        print("PASS: every pairing is byte-identical")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare legacy README updaters with the readme_mmap engine.")
+    parser.add_argument("--repo", help="Use this tracker repository as the only case")
+    parser.add_argument("--cases", type=int, default=1000, help="Number of generated cases (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (default: 0)")
+    parser.add_argument("--filler-rows", type=int, default=50,
+                        help="Maximum extra table rows per generated README (default: 50)")
+    parser.add_argument("--legacy-ref", help="Git revision of the legacy updaters (default: the root commit)")
+    parser.add_argument("--report-dir", help="Write diffs of non-identical cases to this directory")
+    parser.add_argument("--json", dest="json_path", help="Also write the results as JSON")
+    args = parser.parse_args()
+
+    if args.repo:
+        cases = [("repo", *load_repo_case(args.repo))]
+    else:
+        rng = random.Random(args.seed)
+        cases = ((f"case{i:05d}", *generate_case(rng, args.filler_rows)) for i in range(args.cases))
+
+    try:
+        legacy_ref = args.legacy_ref or root_commit()
+        with tempfile.TemporaryDirectory(prefix="shadow-legacy-") as module_dir:
+            engines = build_engines(load_legacy_updaters(legacy_ref, module_dir))
+    except subprocess.CalledProcessError as e:
+        parser.error(f"could not load the legacy updaters from git: {e.stderr.strip()}")
+
+    results = compare(engines, cases, args.report_dir)
+    print_report(results, legacy_ref)
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if not all(byte_identical(s) for s in results.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
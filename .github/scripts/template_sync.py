@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""
+Propagate changes of the course README template into existing course READMEs.
+
+generate_course_readme renders .github/templates/course_readme_template.md once, at
+init time, and learners edit the result. So that template changes can reach those
+files later without wiping the edits, every course directory keeps a small state file
+(.template-state.json) with the template version that produced its README and, per
+"## " section, a fingerprint and the text that was rendered.
+
+On a sync, each course README is handled as follows:
+1. If the template and course data hash to the recorded inputs, the file is skipped
+   without being read
+2. Otherwise the template is re-rendered and only sections whose fingerprint changed
+   are merged: a three-way merge of the recorded section (base), the learner's section
+   and the new section, line by line. Overlapping edits are written with conflict markers
+3. The state file is updated to the new rendering
+
+Files are processed in parallel:
+
+    python .github/scripts/template_sync.py
+    python .github/scripts/template_sync.py --cohort learners/ --dry-run
+
+READMEs generated before this script existed have no state file. --base-ref REV uses
+the template as of a git revision as their base; --adopt records the current template
+as their base without changing them.
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import subprocess
+from difflib import SequenceMatcher
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog import course_dir_name, load_curriculum
+from course_status import collect_learner_roots
+from profiling import profile_from_argv, profiling_active
+
+TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "templates",
+                             "course_readme_template.md")
+
+# State file written next to each course README
+STATE_FILE = ".template-state.json"
+
+# Heading of the text before the first "## " section (the course title)
+PREAMBLE = ""
+
+
+def fingerprint(text):
+    """Return the fingerprint of a piece of template output."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+def inputs_digest(template, course):
+    """Return a digest of everything a course README rendering depends on."""
+    return fingerprint(template + "\0" + json.dumps(course, sort_keys=True))
+
+
+def render(template, course):
+    """Render the course README template, as generate_course_readme does."""
+    return template.format(**course)
+
+
+def split_sections(text):
+    """
+    Split a README into its "## " sections.
+
+    Returns:
+        List of (heading line, section text); the text before the first heading has
+        the heading PREAMBLE. Every section text ends with a newline.
+    """
+    sections = []
+    heading, lines = PREAMBLE, []
+    for line in text.splitlines(True):
+        if line.startswith("## "):
+            if lines or heading != PREAMBLE:
+                sections.append((heading, "".join(lines)))
+            heading, lines = line.strip(), []
+        lines.append(line)
+    if lines or heading != PREAMBLE:
+        sections.append((heading, "".join(lines)))
+    return [(heading, text if text.endswith("\n") else text + "\n") for heading, text in sections]
+
+
+def load_state(course_dir):
+    """Return the recorded template state of a course directory, or None."""
+    try:
+        with open(os.path.join(course_dir, STATE_FILE), "r", encoding="utf-8") as f:
+            state = json.load(f)
+        return state if isinstance(state.get("sections"), list) else None
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def save_state(course_dir, template, course, sections=None):
+    """
+    Record the template rendering a course README is based on.
+
+    Args:
+        course_dir: Course directory holding the README.md
+        template: Template text
+        course: Course dict the template was rendered with
+        sections: Rendered sections, if already computed
+    """
+    if sections is None:
+        sections = split_sections(render(template, course))
+    state = {
+        "template_version": fingerprint(template),
+        "inputs": inputs_digest(template, course),
+        "sections": [
+            {"heading": heading, "fingerprint": fingerprint(text), "text": text}
+            for heading, text in sections
+        ],
+    }
+    state_path = os.path.join(course_dir, STATE_FILE)
+    tmp_path = f"{state_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2)
+    os.replace(tmp_path, state_path)
+
+
+def line_changes(base, other):
+    """Return the (base start, base end, other start, other end) ranges that differ."""
+    matcher = SequenceMatcher(None, base, other, autojunk=False)
+    return [(i1, i2, j1, j2) for tag, i1, i2, j1, j2 in matcher.get_opcodes() if tag != "equal"]
+
+
+def merge_lines(base, ours, theirs):
+    """
+    Three-way merge of lists of lines.
+
+    Changes from ours and theirs that touch the same base lines form one hunk; if both
+    sides changed a hunk differently it is emitted with conflict markers.
+
+    Returns:
+        (merged lines, number of conflicts)
+    """
+    sides = (ours, theirs)
+    hunks = sorted([(*change, 0) for change in line_changes(base, ours)]
+                   + [(*change, 1) for change in line_changes(base, theirs)])
+
+    merged = []
+    conflicts = 0
+    position = k = 0
+    while k < len(hunks):
+        start, end = hunks[k][0], hunks[k][1]
+        group = [hunks[k]]
+        k += 1
+        while k < len(hunks) and hunks[k][0] <= end:
+            end = max(end, hunks[k][1])
+            group.append(hunks[k])
+            k += 1
+
+        versions = []
+        for side in (0, 1):
+            changes = [hunk for hunk in group if hunk[4] == side]
+            cursor, lines = start, []
+            for i1, i2, j1, j2, _ in changes:
+                lines.extend(base[cursor:i1])
+                lines.extend(sides[side][j1:j2])
+                cursor = i2
+            lines.extend(base[cursor:end])
+            versions.append((bool(changes), lines))
+
+        merged.extend(base[position:start])
+        (ours_changed, ours_lines), (theirs_changed, theirs_lines) = versions
+        if not theirs_changed or ours_lines == theirs_lines:
+            merged.extend(ours_lines)
+        elif not ours_changed:
+            merged.extend(theirs_lines)
+        else:
+            conflicts += 1
+            merged.append("<<<<<<< README.md\n")
+            merged.extend(ours_lines)
+            merged.append("||||||| previous template\n")
+            merged.extend(base[start:end])
+            merged.append("=======\n")
+            merged.extend(theirs_lines)
+            merged.append(">>>>>>> current template\n")
+        position = end
+
+    merged.extend(base[position:])
+    return merged, conflicts
+
+
+def merge_section(base, ours, theirs):
+    """Three-way merge of one section's text; returns (text, number of conflicts)."""
+    if base == theirs or ours == theirs:
+        return ours, 0
+    if ours == base:
+        return theirs, 0
+    lines, conflicts = merge_lines(base.splitlines(True), ours.splitlines(True), theirs.splitlines(True))
+    return "".join(lines), conflicts
+
+
+def merge_sections(base, rendered, ours):
+    """
+    Merge a new template rendering into a README section by section.
+
+    Args:
+        base: {heading: text} of the recorded rendering
+        rendered: [(heading, text)] of the new rendering
+        ours: [(heading, text)] of the README
+
+    Sections only the learner has are kept in place. Sections the template dropped are
+    removed unless the learner edited them, new template sections are inserted after
+    the section preceding them in the template, and sections the learner deleted stay
+    deleted.
+
+    Returns:
+        ([(heading, text)], number of conflicts)
+    """
+    new = dict(rendered)
+    merged = []
+    seen = set()
+    conflicts = 0
+    for heading, text in ours:
+        if heading in seen:
+            merged.append((heading, text))
+            continue
+        seen.add(heading)
+        if heading in new:
+            text, section_conflicts = merge_section(base.get(heading, ""), text, new[heading])
+            conflicts += section_conflicts
+        elif base.get(heading) == text:
+            continue
+        merged.append((heading, text))
+
+    for i, (heading, text) in enumerate(rendered):
+        if heading in seen or heading in base:
+            continue
+        position = 0
+        for previous, _ in reversed(rendered[:i]):
+            indexes = [j for j, (merged_heading, _) in enumerate(merged) if merged_heading == previous]
+            if indexes:
+                position = indexes[0] + 1
+                break
+        merged.insert(position, (heading, text))
+    return merged, conflicts
+
+
+def sync_course(course_dir, course, template, base_template=None, adopt=False, dry_run=False):
+    """
+    Bring one course README up to date with the template.
+
+    Args:
+        course_dir: Course directory holding the README.md
+        course: Course dict from the catalog
+        template: Current template text
+        base_template: Template assumed to have produced READMEs that have no state file
+        adopt: Record the current template as the base of READMEs that have no state file
+        dry_run: Report what would change without writing anything
+
+    Returns:
+        (course_dir, result, number of conflicts), result being one of "unchanged",
+        "updated", "conflict", "adopted", "no-state" or an error message.
+    """
+    try:
+        state = load_state(course_dir)
+        if state is not None and state.get("inputs") == inputs_digest(template, course):
+            return course_dir, "unchanged", 0
+
+        if state is None:
+            if base_template is not None:
+                base = dict(split_sections(render(base_template, course)))
+            elif adopt:
+                if not dry_run:
+                    save_state(course_dir, template, course)
+                return course_dir, "adopted", 0
+            else:
+                return course_dir, "no-state", 0
+        else:
+            recorded = {section["heading"]: section["fingerprint"] for section in state["sections"]}
+            base = {section["heading"]: section["text"] for section in state["sections"]}
+
+        rendered = split_sections(render(template, course))
+        if state is not None:
+            # Only sections whose fingerprint changed need merging
+            changed = {heading for heading, text in rendered if recorded.get(heading) != fingerprint(text)}
+            dropped = set(base) - {heading for heading, _ in rendered}
+            if not changed and not dropped:
+                if not dry_run:
+                    save_state(course_dir, template, course, rendered)
+                return course_dir, "unchanged", 0
+
+        readme_path = os.path.join(course_dir, "README.md")
+        with open(readme_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        merged, conflicts = merge_sections(base, rendered, split_sections(content))
+        new_content = "".join(text for _, text in merged)
+        if not content.endswith("\n"):
+            new_content = new_content[:-1] if new_content.endswith("\n") else new_content
+
+        if not dry_run:
+            if new_content != content:
+                tmp_path = f"{readme_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(new_content)
+                os.replace(tmp_path, readme_path)
+            save_state(course_dir, template, course, rendered)
+
+        if conflicts:
+            return course_dir, "conflict", conflicts
+        return course_dir, "updated" if new_content != content else "unchanged", 0
+    except (OSError, KeyError, IndexError, ValueError) as e:
+        return course_dir, f"error: {e}", 0
+
+
+def find_course_dirs(learner_roots):
+    """Yield (course directory, course dict) for every course README in the learner repositories."""
+    courses = [course for category_courses in load_curriculum().values() for course in category_courses]
+    for learner_root in learner_roots:
+        for course in courses:
+            course_dir = os.path.join(learner_root, course_dir_name(course))
+            if os.path.isfile(os.path.join(course_dir, "README.md")):
+                yield course_dir, course
+
+
+def template_at_revision(revision, template_path=TEMPLATE_PATH):
+    """Return the template text as of a git revision."""
+    directory, name = os.path.split(os.path.abspath(template_path))
+    result = subprocess.run(["git", "show", f"{revision}:./{name}"], cwd=directory,
+                            check=True, capture_output=True, text=True)
+    return result.stdout
+
+
+def sync_all(learner_roots, template, base_template=None, adopt=False, dry_run=False, workers=None):
+    """
+    Sync every course README of the learner repositories in parallel.
+
+    Under --profile the READMEs are synced in this process, since the profiler
+    does not see into pool workers.
+
+    Returns:
+        {result: count}
+    """
+    targets = list(find_course_dirs(learner_roots))
+    counts = {}
+    if not targets:
+        return counts
+
+    n = len(targets)
+    arguments = ([d for d, _ in targets], [c for _, c in targets],
+                 [template] * n, [base_template] * n, [adopt] * n, [dry_run] * n)
+    if profiling_active():
+        tally_results(map(sync_course, *arguments), counts)
+        return counts
+
+    chunksize = max(1, n // ((workers or os.cpu_count() or 1) * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        tally_results(executor.map(sync_course, *arguments, chunksize=chunksize), counts)
+    return counts
+
+
+def tally_results(results, counts):
+    """Print the result of each synced README and add it to counts."""
+    for course_dir, result, conflicts in results:
+        if result == "conflict":
+            print(f"CONFLICT: {course_dir}/README.md ({conflicts} conflicting hunks)")
+        elif result.startswith("error"):
+            print(f"ERROR: {course_dir}: {result[len('error: '):]}")
+        elif result in ("updated", "adopted", "no-state"):
+            print(f"{result}: {course_dir}")
+        key = "error" if result.startswith("error") else result
+        counts[key] = counts.get(key, 0) + 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Merge course README template changes into existing course READMEs.")
+    parser.add_argument("learners", nargs="*", help="Learner repository paths (default: current directory)")
+    parser.add_argument("--cohort", help="Directory whose subdirectories are learner repositories")
+    parser.add_argument("--template", default=TEMPLATE_PATH, help="Course README template")
+    state = parser.add_mutually_exclusive_group()
+    state.add_argument("--base-ref", help="Git revision of the template that produced READMEs without state")
+    state.add_argument("--adopt", action="store_true",
+                       help="Record the current template as the base of READMEs without state")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without writing files")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU; none under --profile)")
+    args = parser.parse_args()
+
+    learner_roots = collect_learner_roots(args.learners, args.cohort)
+
+    with open(args.template, "r", encoding="utf-8") as f:
+        template = f.read()
+    base_template = None
+    if args.base_ref:
+        try:
+            base_template = template_at_revision(args.base_ref, args.template)
+        except subprocess.CalledProcessError as e:
+            parser.error(f"could not read the template at {args.base_ref}: {e.stderr.strip()}")
+
+    counts = sync_all(learner_roots, template, base_template, args.adopt, args.dry_run, args.workers)
+    print(", ".join(f"{count} {result}" for result, count in sorted(counts.items())) or "No course READMEs found")
+    if counts.get("no-state"):
+        print("READMEs without template state were skipped; rerun with --base-ref or --adopt")
+    if counts.get("conflict") or counts.get("error"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    with profile_from_argv("template_sync"):
+        main()
@@ -4,11 +4,25 @@ Simple script to update the main README.md with progress information from course
 """
 
 import os
-import json
 import re
+import sys
 
-def update_readme():
-    """Update the README.md with course progress information."""
+from course_status import load_status
+from readme_mmap import update_rows
+from readme_shards import refresh_index, target_for
+from profiling import profile_from_argv
+
+def update_readme(use_mmap=False):
+    """
+    Update the README.md with course progress information.
+
+    Args:
+        use_mmap: Patch each course row in place through readme_mmap instead of
+                  rewriting the whole README
+
+    In the sharded layout (see readme_shards.py) each course row is updated in its
+    category's shard and only the shards that changed are written.
+    """
     # Read the current README
     print("Starting README update process...")
     
@@ -20,6 +34,14 @@ def update_readme():
         print(f"Error reading README.md: {e}")
         return
     
+    # Contents of every file touched so far, by path: README.md or its shards
+    contents = {"README.md": readme_content}
+    originals = dict(contents)
+    # Cells to patch through update_rows in mmap mode, by file and course
+    batches = {}
+    # Files patched by update_rows in mmap mode
+    patched = set()
+    
     # Find all course directories
     course_dirs = [d for d in os.listdir() if os.path.isdir(d) and d not in ['.git', '.github']]
     print(f"Found course directories: {course_dirs}")
@@ -36,12 +58,11 @@ def update_readme():
         
         # Read the status.json file
         try:
-            with open(status_file, "r", encoding="utf-8") as f:
-                status_data = json.load(f)
+            record = load_status(status_file, keep_status=True)
             
-            course_name = status_data.get("course_name", "")
-            status = status_data.get("status", "Not Started")
-            repo_link = status_data.get("repo_link", "")
+            course_name = record.course_name
+            status = record.status
+            repo_link = record.repo_link
             
             print(f"Processing course: {course_name}")
             print(f"Status: {status}")
@@ -55,6 +76,18 @@ def update_readme():
             # Prepare the repo link text
             repo_text = f"[Repo]({repo_link})" if repo_link else ""
             
+            # The course row lives in its shard when the README is sharded
+            target = target_for("README.md", course_name)
+            
+            if use_mmap:
+                batches.setdefault(target, {})[course_name] = {1: status, 2: repo_text}
+                continue
+            
+            if target not in contents:
+                with open(target, "r", encoding="utf-8") as f:
+                    contents[target] = originals[target] = f.read()
+            readme_content = contents[target]
+            
             # Look for the course in the README
             # This pattern is more flexible and will match various formats
             # Convert course name to a more unique pattern by finding key words
@@ -92,6 +125,7 @@ def update_readme():
                     
                     # Replace in README content
                     readme_content = readme_content.replace(full_match, new_line)
+                    contents[target] = readme_content
                     found = True
                     break
                 
@@ -104,13 +138,26 @@ def update_readme():
         except Exception as e:
             print(f"Error processing {status_file}: {e}")
     
-    # Write updated README
+    # Write updated files; in mmap mode each file's rows are patched in one batch
+    changed = [path for path, content in contents.items() if content != originals[path]]
     try:
-        with open("README.md", "w", encoding="utf-8") as f:
-            f.write(readme_content)
+        for path, updates in batches.items():
+            # update_rows reports courses it cannot find itself
+            results = update_rows(path, updates, compact=True)
+            if any(result in ("in-place", "rewrite") for result in results.values()):
+                patched.add(path)
+        
+        for path in changed:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(contents[path])
+        
+        shards = [path for path in patched.union(changed) if path != "README.md"]
+        if shards:
+            refresh_index("README.md", shards)
         print("README.md updated successfully!")
     except Exception as e:
         print(f"Error writing to README.md: {e}")
 
 if __name__ == "__main__":
-    update_readme()
+    with profile_from_argv("update_progress"):
+        update_readme(use_mmap="--mmap" in sys.argv[1:])